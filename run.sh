@@ -1,3 +1,3 @@
 #!/usr/bin/env bash
 # Quick start (for UNIX-like shells). On Windows use PowerShell to run Streamlit.
-streamlit run src/frontend/app.py
+python -m streamlit run src/frontend/app.py
@@ -8,12 +8,16 @@ Assignment: AI Internship - Chatbot with Mem0 and MCP Integration
 """
 
 from .memory_manager import MemoryManager
-from .calendar_integration import CalendarIntegration
+from .calendar_integration import CalendarIntegration, AsyncCalendarIntegration
+from .llm_cache import InMemoryCache, SQLiteCache
 from .chatbot import StudentChatbot
 
 __all__ = [
     'MemoryManager',
     'CalendarIntegration',
+    'AsyncCalendarIntegration',
+    'InMemoryCache',
+    'SQLiteCache',
     'StudentChatbot'
 ]
 
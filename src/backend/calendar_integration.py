@@ -9,7 +9,15 @@ Citations:
 """
 
 import os
-from typing import List, Dict, Optional, Any
+import time
+import asyncio
+import functools
+import itertools
+import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Optional, Any, Tuple, Iterable, Iterator, Callable
 from datetime import datetime, timedelta
 
 # ADDED: MCP SDK imports
@@ -25,6 +33,12 @@ except ImportError:
     McpAuthenticationError = Exception
     McpApiError = Exception
 
+# Optional: orjson decodes MCP response bodies several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ADDED: Import config from your settings file
 from src.config.settings import config
 
@@ -36,6 +50,130 @@ from src.config.settings import config
 # - googleapiclient.errors
 # - pickle
 
+# Authenticated MCP clients shared by every CalendarIntegration in the process.
+# Keyed by (server_url, client_id, scopes); values are (client, expiry) where
+# expiry is measured on the time.monotonic() clock.
+_CLIENT_CACHE: Dict[Tuple, Tuple[Any, float]] = {}
+
+# Sessions are refreshed in the background this many seconds before they expire
+_REFRESH_MARGIN = 300
+
+# Upper bound on concurrent MCP requests issued by a single integration
+_MAX_FETCH_WORKERS = 8
+
+# Calendar memberships change on the order of days, so the list is reused for this long (seconds)
+_CALENDAR_LIST_TTL = 300
+
+_SECONDS_PER_DAY = 86400
+
+# Recent search results are reused for a short window to collapse bursts of identical queries
+_SEARCH_CACHE_SIZE = 32
+_SEARCH_CACHE_TTL = 2.0
+
+# Display format for event start/end times
+_TIME_FMT = '%I:%M %p'
+
+# Layout of a single formatted event; optional lines are empty strings when absent
+_EVENT_TEMPLATE = "📅 **{summary}**\n   ⏰ {time_str}\n{location_line}{description_line}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_rfc3339(value: str) -> datetime:
+    """
+    Parse an RFC3339 timestamp as returned by the Calendar API.
+    
+    Results are cached because the same dateTime strings repeat across
+    recurring events and re-renders of the same list.
+    """
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+
+@functools.lru_cache(maxsize=256)
+def _rfc3339_minute(dt: datetime) -> str:
+    """Format a minute-aligned naive UTC datetime as an RFC3339 string."""
+    return dt.isoformat() + 'Z'
+
+
+def _rfc3339(dt: datetime) -> str:
+    """
+    Format a naive UTC datetime as RFC3339, truncated to the minute.
+    
+    Query windows only need minute precision, and truncating lets repeated
+    calls within the same minute share one cached string.
+    """
+    return _rfc3339_minute(dt.replace(second=0, microsecond=0))
+
+
+def _iso(ts: int) -> str:
+    """Format a Unix timestamp as an RFC3339 UTC string without building a datetime."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts))
+
+
+@functools.lru_cache(maxsize=1)
+def _iso_second(ts: int) -> str:
+    """Memoised _iso() for the current second."""
+    return _iso(ts)
+
+
+def _now_rfc3339_sec() -> str:
+    """Return the current UTC time as RFC3339, formatted at most once per second."""
+    return _iso_second(int(time.time()))
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Return the server-requested delay carried by an MCP error, if any."""
+    value = getattr(error, 'retry_after', None)
+    if value is None:
+        headers = getattr(error, 'headers', None) or {}
+        value = headers.get('Retry-After')
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_transient(error: Exception) -> bool:
+    """Return True for MCP errors worth retrying: 429 and 5xx responses."""
+    status = getattr(error, 'status_code', None) or getattr(error, 'status', None)
+    try:
+        status = int(status)
+    except (TypeError, ValueError):
+        return False
+    return status == 429 or 500 <= status < 600
+
+
+def _retry(max_attempts: int = 3, base_delay: float = 0.1, max_delay: float = 1.0,
+           budget: float = 5.0, exceptions: Tuple = (McpApiError,)):
+    """
+    Retry transient MCP failures (429 and 5xx) with exponential backoff and jitter.
+    
+    Errors that are not transient (400/401/403/404, or without a status) are
+    re-raised immediately. The sleep before attempt n+1 is drawn from
+    [0, min(max_delay, base_delay * 2**n)] unless the error carries a Retry-After.
+    The last error is re-raised once max_attempts is reached or the next sleep
+    would overrun the time budget.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            deadline = time.monotonic() + budget
+            for attempt in range(max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as error:
+                    if attempt == max_attempts - 1 or not _is_transient(error):
+                        raise
+                    delay = _retry_after(error)
+                    if delay is None:
+                        delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+                    if time.monotonic() + delay > deadline:
+                        raise
+                    time.sleep(delay)
+        return wrapper
+    return decorator
+
 
 class CalendarIntegration:
     """
@@ -44,6 +182,10 @@ class CalendarIntegration:
     via the MCP Python SDK.
     """
     
+    # Partial-response field masks: only what format_event() and the UI read
+    _EVENT_FIELDS = 'items(id,summary,start(dateTime,date),end(dateTime,date),location,description),nextPageToken'
+    _CALENDAR_LIST_FIELDS = 'items(id,summary,primary)'
+    
     def __init__(self):
         """
         Initialize Calendar Integration.
@@ -56,7 +198,27 @@ class CalendarIntegration:
         # ADDED: Get MCP server URL from config
         self.mcp_server_url = config.MCP_SERVER_URL
         self.client = None  # This will be the authenticated ContextProtocol client
-        self.service = None # chatbot.py checks for this, so we'll mirror client to it
+        self._service = None # Mirrors client once authenticated; read through the service property
+        
+        # Shared pool for fanning out independent MCP requests (threads are spawned lazily)
+        self._executor = ThreadPoolExecutor(max_workers=_MAX_FETCH_WORKERS, thread_name_prefix="calendar")
+        
+        # (fetched_at, calendars) for the authenticated user, see get_calendar_list()
+        self._calendar_list_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        
+        # (minute, start_of_day, end_of_day) RFC3339 bounds, recomputed at most once a minute
+        self._today_bounds_cache: Optional[Tuple[int, str, str]] = None
+        
+        # LRU of (query, max_results) -> (fetched_at, events), see search_events()
+        self._search_cache: "OrderedDict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._search_lock = threading.Lock()
+        
+        # In-flight requests keyed by their arguments, see _single_flight()
+        self._inflight: Dict[Tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Background timer that renews the MCP session before it expires
+        self._refresh_timer: Optional[threading.Timer] = None
         
         print(f"🗓️  Calendar Integration initialized (MCP Mode). Server: {self.mcp_server_url}")
     
@@ -70,6 +232,22 @@ class CalendarIntegration:
             
         Citation: MCP SDK Authentication Guide
         """
+        key = (self.mcp_server_url, config.GOOGLE_CLIENT_ID, config.GOOGLE_SCOPES)
+        
+        # Reuse a live session instead of repeating the OAuth/verify roundtrip
+        cached = _CLIENT_CACHE.get(key)
+        if cached:
+            client, expiry = cached
+            if time.monotonic() < expiry and client.is_authenticated():
+                if client is not self.client:
+                    self.invalidate_calendar_list_cache()
+                self.client = client
+                self._service = client
+                self._schedule_refresh(key)
+                print("✅ Reusing cached MCP session")
+                return True
+            _CLIENT_CACHE.pop(key, None)
+        
         try:
             print("🔐 Starting MCP OAuth authentication flow...")
             
@@ -86,119 +264,476 @@ class CalendarIntegration:
             )
             
             if self.client and self.client.is_authenticated():
-                # The chatbot.py file checks for 'self.calendar.service'
-                # We set it here to maintain that interface.
-                self.service = self.client 
+                # Exposed to callers through the 'service' property
+                self._service = self.client 
+                self._install_json_loader(self.client)
+                self.invalidate_calendar_list_cache()
+                _CLIENT_CACHE[key] = (self.client, time.monotonic() + config.MCP_TOKEN_TTL)
+                self._schedule_refresh(key)
                 print("✅ Successfully authenticated with Google Calendar via MCP")
                 return True
             else:
-                self.service = None
+                self._service = None
                 print("❌ MCP Authentication failed. Client not authenticated.")
                 return False
             
         except McpAuthenticationError as e:
             print(f"❌ MCP Authentication error: {e}")
-            self.service = None
+            self._service = None
             return False
         except Exception as e:
             # Catch other errors, e.g., config not found
             print(f"❌ General authentication error: {e}")
-            self.service = None
+            self._service = None
             return False
     
+    @property
+    def service(self):
+        """
+        The authenticated MCP client, authenticating lazily on first access.
+        
+        Raises:
+            RuntimeError: If MCP authentication fails
+        """
+        if self._service is None:
+            if not self.authenticate():
+                raise RuntimeError("MCP authentication failed")
+        return self._service
+    
+    def _install_json_loader(self, client):
+        """Swap the MCP client's response decoder for orjson when both support it."""
+        if orjson and hasattr(client, 'json_loads'):
+            client.json_loads = orjson.loads
+    
+    def _schedule_refresh(self, key: Tuple):
+        """
+        Refresh the cached session's token in the background shortly before it
+        expires, so user-facing calls never block on a token refresh.
+        
+        Nothing is scheduled when the client cannot refresh its token on its
+        own; the expired session is then re-authenticated on the next call.
+        """
+        if self._refresh_timer:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        
+        cached = _CLIENT_CACHE.get(key)
+        if not cached or not callable(getattr(cached[0], 'refresh_token', None)):
+            return
+        
+        delay = cached[1] - time.monotonic() - _REFRESH_MARGIN
+        if delay <= 0:
+            return
+        
+        self._refresh_timer = threading.Timer(delay, self._refresh_session, args=(key,))
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+    
+    def _refresh_session(self, key: Tuple):
+        """
+        Refresh the token of the expiring session without user interaction.
+        If the refresh fails the session is dropped from the shared cache and
+        the next call authenticates in the foreground.
+        """
+        cached = _CLIENT_CACHE.get(key)
+        if not cached:
+            return
+        
+        client = cached[0]
+        print("🔄 Refreshing MCP session before expiry...")
+        try:
+            client.refresh_token()
+        except Exception as e:
+            print(f"❌ MCP session refresh failed: {e}")
+            _CLIENT_CACHE.pop(key, None)
+            if self._service is client:
+                self._service = None
+            return
+        
+        _CLIENT_CACHE[key] = (client, time.monotonic() + config.MCP_TOKEN_TTL)
+        self._schedule_refresh(key)
+    
+    def invalidate_calendar_list_cache(self):
+        """Drop the cached calendar list so the next call refetches it."""
+        self._calendar_list_cache = None
+    
+    @_retry()
+    def _list_calendars(self) -> Dict[str, Any]:
+        """Issue the MCP calendar list request (retried on transient errors)."""
+        # Assumed SDK method:
+        return self.service.calendar.list_calendars(fields=self._CALENDAR_LIST_FIELDS)
+    
+    @_retry()
+    def _fetch_events_page(self, **params) -> Dict[str, Any]:
+        """Issue a single MCP events request (retried on transient errors)."""
+        # REPLACED: Direct Google API call
+        # This is the new call using the assumed MCP SDK interface
+        return self.service.calendar.get_events(fields=self._EVENT_FIELDS, **params)
+    
+    @_retry()
+    def _search_events_page(self, **params) -> Dict[str, Any]:
+        """Issue an MCP event search request (retried on transient errors)."""
+        # Assumed SDK method:
+        return self.service.calendar.search_events(fields=self._EVENT_FIELDS, **params)
+    
     def get_calendar_list(self) -> List[Dict[str, Any]]:
         """
         Retrieve list of all calendars using the MCP client.
         
+        Results are cached for _CALENDAR_LIST_TTL seconds and invalidated
+        whenever the integration re-authenticates.
+        
         Returns:
             list: List of calendar objects
         """
         try:
-            if not self.service:
-                print("❌ MCP Service not initialized. Please authenticate first.")
-                return []
+            cached = self._calendar_list_cache
+            if cached and time.monotonic() - cached[0] < _CALENDAR_LIST_TTL:
+                return cached[1]
             
-            # Assumed SDK method:
-            calendar_list = self.service.calendar.list_calendars()
-            calendars = calendar_list.get('items', [])
+            calendars = self._list_calendars().get('items', [])
+            self._calendar_list_cache = (time.monotonic(), calendars)
             
             print(f"✅ Retrieved {len(calendars)} calendars via MCP")
             return calendars
             
-        except McpApiError as error:
+        except (McpApiError, RuntimeError) as error:
             print(f"❌ Error retrieving MCP calendar list: {error}")
             return []
     
-    def get_events(
+    @staticmethod
+    def _resolve_bounds(
+        time_min: Optional[datetime],
+        time_max: Optional[datetime],
+        time_min_str: Optional[str],
+        time_max_str: Optional[str]
+    ) -> Tuple[str, str]:
+        """Return RFC3339 query bounds, defaulting to the next 7 days."""
+        if time_min_str is None or time_max_str is None:
+            # Set default time range if not provided
+            if time_min is None:
+                time_min = datetime.utcnow()
+            if time_max is None:
+                time_max = time_min + timedelta(days=7)
+            
+            # Convert datetime to RFC3339 format
+            time_min_str = time_min_str or _rfc3339(time_min)
+            time_max_str = time_max_str or _rfc3339(time_max)
+        return time_min_str, time_max_str
+    
+    def _single_flight(self, key: Tuple, fetch: Callable[[], Any]) -> Any:
+        """
+        Run fetch() once for concurrent callers sharing the same key.
+        
+        The first caller performs the request; callers arriving while it is
+        in flight wait on its Future and receive the same result (or error).
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        
+        if not leader:
+            return future.result()
+        
+        try:
+            result = fetch()
+            future.set_result(result)
+            return result
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def iter_events(
         self,
         calendar_id: str = 'primary',
         time_min: Optional[datetime] = None,
         time_max: Optional[datetime] = None,
         max_results: int = 10,
         single_events: bool = True,
-        order_by: str = 'startTime'
-    ) -> List[Dict[str, Any]]:
+        order_by: str = 'startTime',
+        time_min_str: Optional[str] = None,
+        time_max_str: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Retrieve calendar events using the MCP client.
+        Lazily yield calendar events using the MCP client.
+        
+        At most max_results events are yielded. When the server returns a
+        partial page with a nextPageToken, the following page is requested
+        only once the caller has consumed the current one, so a caller that
+        stops early never pays for the remaining pages.
         
         Args:
-            (Args are the same as the original)
+            (Args are the same as get_events)
+            time_min_str (str, optional): Pre-formatted RFC3339 lower bound;
+                takes precedence over time_min
+            time_max_str (str, optional): Pre-formatted RFC3339 upper bound;
+                takes precedence over time_max
             
-        Returns:
-            list: List of event objects
-        """
-        try:
-            if not self.service:
-                print("❌ MCP Service not initialized. Please authenticate first.")
-                return []
-            
-            # Set default time range if not provided (logic is unchanged)
-            if time_min is None:
-                time_min = datetime.utcnow()
-            if time_max is None:
-                time_max = time_min + timedelta(days=7)
+        Yields:
+            dict: Event objects
             
-            # Convert datetime to RFC3339 format (logic is unchanged)
-            time_min_str = time_min.isoformat() + 'Z'
-            time_max_str = time_max.isoformat() + 'Z'
-            
-            # REPLACED: Direct Google API call
-            # This is the new call using the assumed MCP SDK interface
-            events_result = self.service.calendar.get_events(
+        Raises:
+            McpApiError: If an MCP request fails
+            RuntimeError: If MCP authentication fails
+        """
+        time_min_str, time_max_str = self._resolve_bounds(time_min, time_max, time_min_str, time_max_str)
+        
+        remaining = max_results
+        page_token = None
+        while remaining > 0:
+            events_result = self._fetch_events_page(
                 calendar_id=calendar_id,
                 time_min=time_min_str,
                 time_max=time_max_str,
-                max_results=max_results,
+                max_results=remaining,
                 single_events=single_events,
-                order_by=order_by
+                order_by=order_by,
+                page_token=page_token
             )
             
-            events = events_result.get('items', [])
+            items = events_result.get('items', [])[:remaining]
+            yield from items
+            remaining -= len(items)
+            
+            page_token = events_result.get('nextPageToken')
+            if not page_token:
+                break
+    
+    def _get_events_raw(
+        self,
+        time_min_str: str,
+        time_max_str: str,
+        calendar_id: str = 'primary',
+        max_results: int = 10,
+        single_events: bool = True,
+        order_by: str = 'startTime'
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve calendar events for pre-formatted RFC3339 bounds.
+        
+        Callers that already hold RFC3339 strings (today/week helpers) call
+        this directly and skip the datetime round trip.
+        
+        Returns:
+            list: List of event objects
+            
+        Raises:
+            McpApiError: If an MCP request fails
+            RuntimeError: If MCP authentication fails
+            
+        Errors are raised rather than returned as [], so callers can tell
+        "no events" apart from "could not fetch events".
+        """
+        key = ('events', calendar_id, time_min_str, time_max_str, max_results, single_events, order_by)
+        
+        try:
+            events = self._single_flight(key, lambda: list(self.iter_events(
+                calendar_id=calendar_id,
+                max_results=max_results,
+                single_events=single_events,
+                order_by=order_by,
+                time_min_str=time_min_str,
+                time_max_str=time_max_str
+            )))
             print(f"✅ Retrieved {len(events)} events via MCP")
             return events
             
-        except McpApiError as error:
+        except (McpApiError, RuntimeError) as error:
             print(f"❌ Error retrieving MCP events: {error}")
-            return []
+            raise
     
-    def get_today_events(self) -> List[Dict[str, Any]]:
+    def get_events(
+        self,
+        calendar_id: str = 'primary',
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        max_results: int = 10,
+        single_events: bool = True,
+        order_by: str = 'startTime'
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve calendar events using the MCP client.
+        
+        Args:
+            (Args are the same as the original)
+            
+        Returns:
+            list: List of event objects
+            
+        Raises:
+            McpApiError: If an MCP request fails
+            RuntimeError: If MCP authentication fails
         """
-        Get all events for today. (Logic is unchanged)
+        time_min_str, time_max_str = self._resolve_bounds(time_min, time_max, None, None)
+        return self._get_events_raw(
+            time_min_str,
+            time_max_str,
+            calendar_id=calendar_id,
+            max_results=max_results,
+            single_events=single_events,
+            order_by=order_by
+        )
+    
+    def get_events_all_calendars(
+        self,
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        max_results: int = 10
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """
-        now = datetime.utcnow()
-        start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_day = start_of_day + timedelta(days=1)
+        Retrieve events from every calendar the user has access to.
         
-        return self.get_events(time_min=start_of_day, time_max=end_of_day)
+        Per-calendar requests are issued concurrently, so the wall clock is
+        bounded by the slowest calendar rather than the number of calendars.
+        
+        Args:
+            time_min (datetime, optional): Start of the time window
+            time_max (datetime, optional): End of the time window
+            max_results (int): Maximum number of events per calendar
+        
+        Returns:
+            dict: Mapping of calendar ID to its list of events
+            
+        Raises:
+            McpApiError: If an MCP request fails
+            RuntimeError: If MCP authentication fails
+        """
+        calendar_ids = [cal['id'] for cal in self.get_calendar_list() if 'id' in cal]
+        futures = {
+            calendar_id: self._executor.submit(
+                self.get_events,
+                calendar_id=calendar_id,
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results
+            )
+            for calendar_id in calendar_ids
+        }
+        return {calendar_id: future.result() for calendar_id, future in futures.items()}
+    
+    def _today_bounds(self) -> Tuple[str, str]:
+        """Return RFC3339 (start, end) bounds of the current UTC day."""
+        ts = int(time.time())
+        minute = ts // 60
+        cached = self._today_bounds_cache
+        if cached is None or cached[0] != minute:
+            day_start = ts - ts % _SECONDS_PER_DAY
+            cached = (minute, _iso(day_start), _iso(day_start + _SECONDS_PER_DAY))
+            self._today_bounds_cache = cached
+        return cached[1], cached[2]
+    
+    def _week_bounds(self) -> Tuple[str, str]:
+        """Return RFC3339 (now, now + 7 days) bounds used for the weekly view."""
+        ts = int(time.time())
+        return _iso(ts), _iso(ts + 7 * _SECONDS_PER_DAY)
+    
+    def get_today_events(self, bundle: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Get all events for today.
+        
+        Args:
+            bundle (dict, optional): Result of get_dashboard_bundle(); reused
+                instead of issuing a new request when it holds today's events.
+        """
+        if bundle and 'today' in bundle:
+            return bundle['today']
+        
+        start_of_day, end_of_day = self._today_bounds()
+        return self._get_events_raw(start_of_day, end_of_day)
+    
+    def get_week_events(self, bundle: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Get all events for the current week.
+        
+        Args:
+            bundle (dict, optional): Result of get_dashboard_bundle(); reused
+                instead of issuing a new request when it holds this week's events.
+        """
+        if bundle and 'week' in bundle:
+            return bundle['week']
+        
+        now, end_of_week = self._week_bounds()
+        return self._get_events_raw(now, end_of_week, max_results=50)
     
-    def get_week_events(self) -> List[Dict[str, Any]]:
+    def get_dashboard_bundle(self, query: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Get all events for the current week. (Logic is unchanged)
+        Fetch today's events, this week's events, the calendar list and
+        (optionally) search results in one round trip.
+        
+        Uses the MCP client's batch primitive when the SDK provides one and
+        otherwise issues the requests concurrently, so a dashboard render pays
+        for the slowest request instead of the sum of all of them.
+        
+        Args:
+            query (str, optional): Search query to include in the bundle
+            
+        Returns:
+            dict: Mapping of 'today', 'week', 'calendars' (and 'search') to item lists
         """
-        now = datetime.utcnow()
-        end_of_week = now + timedelta(days=7)
+        try:
+            service = self.service
+        except RuntimeError as error:
+            print(f"❌ Error retrieving MCP dashboard bundle: {error}")
+            bundle = {"today": [], "week": [], "calendars": []}
+            if query:
+                bundle["search"] = []
+            return bundle
+        
+        if hasattr(service, 'batch'):
+            today_min, today_max = self._today_bounds()
+            week_min, week_max = self._week_bounds()
+            requests = [
+                {"id": "today", "method": "calendar.get_events", "params": {
+                    "calendar_id": "primary",
+                    "time_min": today_min,
+                    "time_max": today_max,
+                    "max_results": 10, "single_events": True, "order_by": "startTime",
+                    "fields": self._EVENT_FIELDS}},
+                {"id": "week", "method": "calendar.get_events", "params": {
+                    "calendar_id": "primary",
+                    "time_min": week_min,
+                    "time_max": week_max,
+                    "max_results": 50, "single_events": True, "order_by": "startTime",
+                    "fields": self._EVENT_FIELDS}},
+                {"id": "calendars", "method": "calendar.list_calendars", "params": {
+                    "fields": self._CALENDAR_LIST_FIELDS}},
+            ]
+            if query:
+                requests.append({"id": "search", "method": "calendar.search_events", "params": {
+                    "calendar_id": "primary",
+                    "time_min": _now_rfc3339_sec(),
+                    "max_results": 10, "query": query,
+                    "single_events": True, "order_by": "startTime",
+                    "fields": self._EVENT_FIELDS}})
+            try:
+                responses = service.batch(requests)
+                bundle = {rid: (result or {}).get('items', []) for rid, result in responses.items()}
+                print(f"✅ Retrieved dashboard bundle ({len(requests)} requests) via MCP batch")
+                return bundle
+            except McpApiError as error:
+                print(f"❌ MCP batch request failed, falling back to concurrent requests: {error}")
         
-        return self.get_events(time_min=now, time_max=end_of_week, max_results=50)
+        futures = {
+            "today": self._executor.submit(self.get_today_events),
+            "week": self._executor.submit(self.get_week_events),
+            "calendars": self._executor.submit(self.get_calendar_list),
+        }
+        if query:
+            futures["search"] = self._executor.submit(self.search_events, query)
+        
+        bundle = {}
+        for rid, future in futures.items():
+            try:
+                bundle[rid] = future.result()
+            except (McpApiError, RuntimeError) as error:
+                print(f"❌ Error retrieving MCP dashboard bundle: {error}")
+                bundle[rid] = []
+        return bundle
     
     def format_event(self, event: Dict[str, Any]) -> str:
         """
@@ -217,54 +752,72 @@ class CalendarIntegration:
             description = event.get('description', 'No description')
             
             if 'dateTime' in start:
-                start_time = datetime.fromisoformat(start['dateTime'].replace('Z', '+00:00'))
-                end_time = datetime.fromisoformat(end['dateTime'].replace('Z', '+00:00'))
-                time_str = f"{start_time.strftime('%I:%M %p')} - {end_time.strftime('%I:%M %p')}"
+                start_time = _parse_rfc3339(start['dateTime'])
+                end_time = _parse_rfc3339(end['dateTime'])
+                time_str = f"{start_time.strftime(_TIME_FMT)} - {end_time.strftime(_TIME_FMT)}"
             else:
                 start_date = start.get('date', 'N/A')
                 time_str = f"All day ({start_date})"
             
-            formatted = f"📅 **{summary}**\n"
-            formatted += f"   ⏰ {time_str}\n"
-            
+            location_line = ""
             if location != 'No location':
-                formatted += f"   📍 {location}\n"
+                location_line = f"   📍 {location}\n"
             
+            description_line = ""
             if description != 'No description' and description:
                 desc = description[:100] + "..." if len(description) > 100 else description
-                formatted += f"   📝 {desc}\n"
+                description_line = f"   📝 {desc}\n"
             
-            return formatted
+            return _EVENT_TEMPLATE.format_map({
+                'summary': summary,
+                'time_str': time_str,
+                'location_line': location_line,
+                'description_line': description_line
+            })
             
         except Exception as e:
             return f"Error formatting event: {e}"
     
-    def format_events_list(self, events: List[Dict[str, Any]]) -> str:
+    def format_events_list(self, events: Iterable[Dict[str, Any]], limit: Optional[int] = None) -> str:
         """
-        Format a list of events into a readable string. (Logic is unchanged)
+        Format a list of events into a readable string.
+        
+        Args:
+            events (iterable): Event objects, e.g. a list or iter_events()
+            limit (int, optional): Only format the first `limit` events; the
+                rest of a lazy iterator is never fetched
         """
+        if limit is not None:
+            events = itertools.islice(events, limit)
+        # Materialised once: the header needs the event count
+        events = list(events)
+        
         if not events:
             return "No upcoming events found."
         
-        formatted = f"Found {len(events)} event(s):\n\n"
-        for i, event in enumerate(events, 1):
-            formatted += f"{i}. {self.format_event(event)}\n"
+        parts = [f"Found {len(events)} event(s):\n"]
+        parts.extend(f"{i}. {self.format_event(event)}" for i, event in enumerate(events, 1))
         
-        return formatted
+        return "\n".join(parts) + "\n"
     
     def search_events(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
         """
         Search for events matching a query string using MCP client.
+        
+        Identical searches within _SEARCH_CACHE_TTL seconds are served from
+        a small LRU cache, so rapid repeated queries cost one network call.
         """
+        key = (query, max_results)
+        with self._search_lock:
+            cached = self._search_cache.get(key)
+            if cached and time.monotonic() - cached[0] < _SEARCH_CACHE_TTL:
+                self._search_cache.move_to_end(key)
+                return cached[1]
+        
         try:
-            if not self.service:
-                print("❌ MCP Service not initialized. Please authenticate first.")
-                return []
+            now = _now_rfc3339_sec()
             
-            now = datetime.utcnow().isoformat() + 'Z'
-            
-            # Assumed SDK method:
-            events_result = self.service.calendar.search_events(
+            events_result = self._search_events_page(
                 calendar_id='primary',
                 time_min=now,
                 max_results=max_results,
@@ -274,14 +827,76 @@ class CalendarIntegration:
             )
             
             events = events_result.get('items', [])
+            with self._search_lock:
+                self._search_cache[key] = (time.monotonic(), events)
+                self._search_cache.move_to_end(key)
+                if len(self._search_cache) > _SEARCH_CACHE_SIZE:
+                    self._search_cache.popitem(last=False)
+            
             print(f"✅ Found {len(events)} events matching '{query}' via MCP")
             return events
             
-        except McpApiError as error:
+        except (McpApiError, RuntimeError) as error:
             print(f"❌ Error searching MCP events: {error}")
             return []
 
 
+
+class AsyncCalendarIntegration:
+    """
+    Awaitable facade over CalendarIntegration.
+    
+    Each MCP call runs in a worker thread, so callers can overlap calendar
+    fetches with other I/O (e.g. an LLM request) via asyncio.gather while
+    sharing the sync integration's session, caches and single-flight guard.
+    """
+    
+    def __init__(self, calendar: Optional[CalendarIntegration] = None):
+        """
+        Initialize the async facade.
+        
+        Args:
+            calendar (CalendarIntegration, optional): Integration to wrap;
+                a new one is created if not provided
+        """
+        self.calendar = calendar or CalendarIntegration()
+    
+    async def authenticate(self) -> bool:
+        """Authenticate the wrapped integration."""
+        return await asyncio.to_thread(self.calendar.authenticate)
+    
+    async def get_calendar_list(self) -> List[Dict[str, Any]]:
+        """Retrieve the list of calendars."""
+        return await asyncio.to_thread(self.calendar.get_calendar_list)
+    
+    async def get_events(self, **kwargs) -> List[Dict[str, Any]]:
+        """Retrieve calendar events; accepts the same arguments as CalendarIntegration.get_events."""
+        return await asyncio.to_thread(self.calendar.get_events, **kwargs)
+    
+    async def get_today_events(self) -> List[Dict[str, Any]]:
+        """Get all events for today."""
+        return await asyncio.to_thread(self.calendar.get_today_events)
+    
+    async def get_week_events(self) -> List[Dict[str, Any]]:
+        """Get all events for the current week."""
+        return await asyncio.to_thread(self.calendar.get_week_events)
+    
+    async def search_events(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
+        """Search for events matching a query string."""
+        return await asyncio.to_thread(self.calendar.search_events, query, max_results)
+    
+    async def get_dashboard_bundle(self, query: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch the dashboard bundle (today, week, calendars and optional search)."""
+        return await asyncio.to_thread(self.calendar.get_dashboard_bundle, query)
+    
+    async def get_events_all_calendars(self, **kwargs) -> Dict[str, List[Dict[str, Any]]]:
+        """Retrieve events from every calendar the user has access to."""
+        return await asyncio.to_thread(self.calendar.get_events_all_calendars, **kwargs)
+    
+    def format_events_list(self, events: Iterable[Dict[str, Any]], limit: Optional[int] = None) -> str:
+        """Format events for display (CPU-only, so not awaited)."""
+        return self.calendar.format_events_list(events, limit)
+
 # Example usage and testing
 if __name__ == "__main__":
     # Initialize calendar integration
@@ -9,19 +9,95 @@ Citations:
 """
 
 import os
-from typing import List, Dict, Any, Optional
+import time
+import functools
+import asyncio
+import itertools
+import threading
+import queue
+from typing import List, Dict, Any, Optional, Coroutine, AsyncIterator, Iterator, Deque, DefaultDict, Tuple, Callable, Awaitable
+from collections import defaultdict, deque
 from datetime import datetime, timedelta
 import json
 import re
 
-from memory_manager import MemoryManager
-from calendar_integration import CalendarIntegration
+from src.backend.memory_manager import MemoryManager, request_scope
+from src.backend.calendar_integration import CalendarIntegration, AsyncCalendarIntegration
+from src.backend.llm_cache import InMemoryCache, make_cache_key
 
 try:
-    from openai import OpenAI
+    import httpx
+    from openai import AsyncOpenAI, APIConnectionError, RateLimitError
+    # Transient failures worth retrying (APITimeoutError subclasses APIConnectionError)
+    _RETRYABLE_OPENAI_ERRORS = (RateLimitError, APIConnectionError)
 except ImportError:
     print("OpenAI library not installed. Install with: pip install openai")
-    OpenAI = None
+    AsyncOpenAI = None
+    _RETRYABLE_OPENAI_ERRORS = ()
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Retry policy for chat completions: up to 3 attempts, doubling the delay each time
+_OPENAI_MAX_ATTEMPTS = 3
+_OPENAI_BASE_DELAY = 1.0
+
+# Keep-alive pool shared by all OpenAI requests from one chatbot
+_HTTP_MAX_KEEPALIVE = 20
+_HTTP_MAX_CONNECTIONS = 40
+_HTTP_TIMEOUT = 30.0
+
+# Conversation history is stored as (role_id, content, unix_time) tuples, bounded per user
+_HISTORY_MAXLEN = 200
+_ROLES = ("system", "user", "assistant")
+_ROLE_IDS = {role: role_id for role_id, role in enumerate(_ROLES)}
+
+# Turns pushed out of a full history are archived to Mem0 in batches of this size
+_ARCHIVE_BATCH = 20
+
+# Seconds a rendered calendar listing is reused for repeat queries
+_CALENDAR_CACHE_TTL = 60.0
+
+# Chat completion settings (also part of the response cache key)
+_CHAT_MODEL = "gpt-4"
+
+# History messages placed after the dynamic memory context rather than before it
+_RECENT_TURNS = 2
+
+# Prompt token budgets for conversation history and retrieved memories
+_HISTORY_TOKEN_BUDGET = 2000
+_MEMORY_TOKEN_BUDGET = 500
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+    """Return the tiktoken encoding for the chat model, or None if unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(_CHAT_MODEL)
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _count_tokens(text: str) -> int:
+    """
+    Count the tokens in text for the chat model.
+    Falls back to a ~4 characters per token estimate without tiktoken.
+    
+    Args:
+        text (str): Text to measure
+        
+    Returns:
+        int: Token count
+    """
+    encoding = _get_encoding()
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text))
 
 
 class StudentChatbot:
@@ -30,11 +106,43 @@ class StudentChatbot:
     to assist students with scheduling and personalized interactions.
     """
     
+    # Intent keywords, matched case-insensitively as substrings of the message.
+    # Categories are listed in priority order; the first one with a match wins.
+    _INTENT_KEYWORDS = {
+        'calendar_query': [
+            'schedule', 'meeting', 'calendar', 'event', 'appointment',
+            'today', 'tomorrow', 'this week', 'next week', 'when is'
+        ],
+        'store_memory': [
+            'remember', 'i prefer', 'my favorite', 'i like', 'i usually',
+            'note that', 'keep in mind'
+        ],
+        'recall_memory': [
+            'what do you know about me', 'what have i told you',
+            'my preferences', 'what do i like', 'remind me'
+        ]
+    }
+    # One pattern for all categories: an optional lookahead per category, each capturing
+    # into a group named after its intent, so a single match() reports every category hit
+    _INTENT_RE = re.compile(
+        ''.join(
+            f"(?=.*?(?P<{intent}>{'|'.join(map(re.escape, keywords))}))?"
+            for intent, keywords in _INTENT_KEYWORDS.items()
+        ),
+        re.I | re.S
+    )
+    # Calendar time frames, same scheme; listed in priority order
+    _TIME_FRAME_RE = re.compile(
+        r"(?=.*?(?P<today>today))?(?=.*?(?P<week>week))?(?=.*?(?P<tomorrow>tomorrow))?",
+        re.I | re.S
+    )
+    
     def __init__(
         self,
         openai_api_key: Optional[str] = None,
         memory_manager: Optional[MemoryManager] = None,
-        calendar_integration: Optional[CalendarIntegration] = None
+        calendar_integration: Optional[CalendarIntegration] = None,
+        response_cache: Optional[Any] = None
     ):
         """
         Initialize the Student Chatbot.
@@ -43,11 +151,21 @@ class StudentChatbot:
             openai_api_key (str, optional): OpenAI API key
             memory_manager (MemoryManager, optional): Memory manager instance
             calendar_integration (CalendarIntegration, optional): Calendar integration instance
+            response_cache (optional): LLM response cache (InMemoryCache or SQLiteCache);
+                defaults to an in-memory LRU cache
         """
-        # Initialize OpenAI client
         self.openai_api_key = openai_api_key or os.getenv('OPENAI_API_KEY')
-        if OpenAI and self.openai_api_key:
-            self.client = OpenAI(api_key=self.openai_api_key)
+        # Initialize OpenAI client on a pooled HTTP client so TLS connections are reused
+        self._http = None
+        if AsyncOpenAI and self.openai_api_key:
+            self._http = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_keepalive_connections=_HTTP_MAX_KEEPALIVE,
+                    max_connections=_HTTP_MAX_CONNECTIONS
+                ),
+                timeout=_HTTP_TIMEOUT
+            )
+            self.client = AsyncOpenAI(api_key=self.openai_api_key, http_client=self._http)
         else:
             self.client = None
             print("⚠️  OpenAI client not initialized")
@@ -55,9 +173,27 @@ class StudentChatbot:
         # Initialize components
         self.memory_manager = memory_manager or MemoryManager()
         self.calendar = calendar_integration or CalendarIntegration()
+        self.acalendar = AsyncCalendarIntegration(self.calendar)
+        
+        # Rendered event listings keyed by (user_id, time_frame) -> (expiry, text)
+        self._calendar_cache: Dict[Tuple[str, str], Tuple[float, str]] = {}
+        
+        # Cache of completion texts keyed by the exact request messages
+        self.response_cache = response_cache if response_cache is not None else InMemoryCache()
         
         # Conversation history
-        self.conversation_history: Dict[str, List[Dict]] = {}
+        self.conversation_history: DefaultDict[str, Deque[Tuple[int, str, float]]] = defaultdict(
+            lambda: deque(maxlen=_HISTORY_MAXLEN)
+        )
+        
+        # Evicted turns waiting to be archived, and archive jobs still running
+        self._archive_pending: DefaultDict[str, List[Tuple[int, str, float]]] = defaultdict(list)
+        self._archive_tasks: set = set()
+        
+        # Event loop used by the synchronous chat() entry point, started on first use.
+        # A single long-lived loop keeps the async OpenAI client's connection pool valid.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
         
         # System prompt for the chatbot
         self.system_prompt = """You are a helpful AI assistant for students. Your capabilities include:
@@ -72,21 +208,75 @@ When you learn new information about a student, acknowledge that you'll remember
         
         print("🤖 Student Chatbot initialized successfully")
     
-    def _get_conversation_history(self, user_id: str) -> List[Dict]:
-        """Get conversation history for a user."""
-        if user_id not in self.conversation_history:
-            self.conversation_history[user_id] = []
-        return self.conversation_history[user_id]
+    def _run_sync(self, coro: Coroutine) -> Any:
+        """
+        Run a coroutine on the chatbot's background event loop and wait for it.
+        
+        Args:
+            coro (coroutine): Coroutine to execute
+            
+        Returns:
+            Any: The coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()
+    
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background event loop, starting its thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="chatbot-loop", daemon=True).start()
+            return self._loop
+    
+    def _get_conversation_history(self, user_id: str, last: Optional[int] = None) -> List[Dict]:
+        """
+        Get conversation history for a user as message dicts.
+        
+        Args:
+            user_id (str): User ID
+            last (int, optional): Only return the most recent N messages
+            
+        Returns:
+            list: Messages with role, content and timestamp (unix time)
+        """
+        turns = self.conversation_history.get(user_id, ())
+        if last is not None:
+            turns = reversed(list(itertools.islice(reversed(turns), last)))
+        return [
+            {"role": _ROLES[role_id], "content": content, "timestamp": ts}
+            for role_id, content, ts in turns
+        ]
     
     def _add_to_history(self, user_id: str, role: str, content: str):
-        """Add a message to conversation history."""
-        if user_id not in self.conversation_history:
-            self.conversation_history[user_id] = []
-        self.conversation_history[user_id].append({
-            "role": role,
-            "content": content,
-            "timestamp": datetime.now().isoformat()
-        })
+        """Add a message to conversation history, archiving turns that fall out of it."""
+        history = self.conversation_history[user_id]
+        if len(history) == history.maxlen:
+            pending = self._archive_pending[user_id]
+            pending.append(history[0])
+            if len(pending) >= _ARCHIVE_BATCH:
+                self._schedule_archive(user_id, pending[:])
+                pending.clear()
+        history.append((_ROLE_IDS[role], content, time.time()))
+    
+    def _schedule_archive(self, user_id: str, turns: List[Tuple[int, str, float]]):
+        """
+        Store evicted turns in long-term memory without blocking the caller.
+        
+        Args:
+            user_id (str): User ID
+            turns (list): History tuples to archive
+        """
+        coro = self.memory_manager.aadd_memory(
+            user_id,
+            [{"role": _ROLES[role_id], "content": content} for role_id, content, _ in turns],
+            metadata={"category": "conversation_archive", "source": "conversation"}
+        )
+        try:
+            task = asyncio.get_running_loop().create_task(coro)
+        except RuntimeError:
+            task = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        self._archive_tasks.add(task)
+        task.add_done_callback(self._archive_tasks.discard)
     
     def _detect_intent(self, message: str) -> str:
         """
@@ -98,35 +288,11 @@ When you learn new information about a student, acknowledge that you'll remember
         Returns:
             str: Detected intent
         """
-        message_lower = message.lower()
-        
-        # Calendar-related intents
-        calendar_keywords = [
-            'schedule', 'meeting', 'calendar', 'event', 'appointment',
-            'today', 'tomorrow', 'this week', 'next week', 'when is'
-        ]
-        if any(keyword in message_lower for keyword in calendar_keywords):
-            return 'calendar_query'
-        
-        # Memory storage intents
-        memory_keywords = [
-            'remember', 'i prefer', 'my favorite', 'i like', 'i usually',
-            'note that', 'keep in mind'
-        ]
-        if any(keyword in message_lower for keyword in memory_keywords):
-            return 'store_memory'
-        
-        # Memory retrieval intents
-        recall_keywords = [
-            'what do you know about me', 'what have i told you',
-            'my preferences', 'what do i like', 'remind me'
-        ]
-        if any(keyword in message_lower for keyword in recall_keywords):
-            return 'recall_memory'
-        
-        return 'general_conversation'
+        # First matching category wins (groupdict() keeps priority order)
+        matches = self._INTENT_RE.match(message).groupdict()
+        return next((intent for intent, hit in matches.items() if hit), 'general_conversation')
     
-    def _handle_calendar_query(self, user_id: str, message: str) -> str:
+    async def _handle_calendar_query(self, user_id: str, message: str) -> str:
         """
         Handle calendar-related queries.
         
@@ -138,50 +304,93 @@ When you learn new information about a student, acknowledge that you'll remember
             str: Response with calendar information
         """
         try:
-            message_lower = message.lower()
-            
-            # Authenticate if not already done
-            if not self.calendar.service:
-                auth_success = self.calendar.authenticate()
-                if not auth_success:
-                    return "I'm having trouble accessing your calendar. Please ensure you've granted permission and try again."
+            frame = self._TIME_FRAME_RE.match(message)
             
-            # Determine time range based on query
-            if 'today' in message_lower:
-                events = self.calendar.get_today_events()
+            # Determine time range based on query (the calendar authenticates lazily on first use)
+            if frame['today']:
+                fetch = self.acalendar.get_today_events
                 time_frame = "today"
-            elif 'this week' in message_lower or 'week' in message_lower:
-                events = self.calendar.get_week_events()
+            elif frame['week']:
+                fetch = self.acalendar.get_week_events
                 time_frame = "this week"
-            elif 'tomorrow' in message_lower:
+            elif frame['tomorrow']:
                 tomorrow = datetime.utcnow() + timedelta(days=1)
                 tomorrow_start = tomorrow.replace(hour=0, minute=0, second=0)
                 tomorrow_end = tomorrow_start + timedelta(days=1)
-                events = self.calendar.get_events(time_min=tomorrow_start, time_max=tomorrow_end)
+                fetch = functools.partial(self.acalendar.get_events, time_min=tomorrow_start, time_max=tomorrow_end)
                 time_frame = "tomorrow"
             else:
                 # Default to next 7 days
-                events = self.calendar.get_week_events()
+                fetch = self.acalendar.get_week_events
                 time_frame = "upcoming"
             
-            if not events:
+            # Fetch events and look up relevant preferences concurrently
+            events_text, memories = await asyncio.gather(
+                self._get_events_text(user_id, time_frame, fetch),
+                self.memory_manager.asearch_memories(user_id, "study schedule preference")
+            )
+            
+            if not events_text:
                 return f"You don't have any events scheduled for {time_frame}. Your schedule is clear!"
             
             # Format the response
             response = f"Here are your events for {time_frame}:\n\n"
-            response += self.calendar.format_events_list(events)
+            response += events_text
             
-            # Check memories for relevant preferences
-            memories = self.memory_manager.search_memories(user_id, "study schedule preference")
+            # Add relevant preferences
             if memories:
                 response += f"\n💡 Based on your preferences: {memories[0].get('memory', '')}"
             
             return response
             
+        except RuntimeError:
+            # Raised by CalendarIntegration.service when authentication fails
+            return "I'm having trouble accessing your calendar. Please ensure you've granted permission and try again."
         except Exception as e:
             return f"I encountered an error while accessing your calendar: {str(e)}"
     
-    def _handle_memory_storage(self, user_id: str, message: str) -> str:
+    async def _get_events_text(self, user_id: str, time_frame: str, fetch: Callable[[], Awaitable[List[Dict]]]) -> str:
+        """
+        Return the formatted event list for a time frame, reusing a rendering
+        from the last 60 seconds when available. Only successful fetches are
+        cached; a failed fetch raises and is retried on the next query.
+        
+        Args:
+            user_id (str): User ID
+            time_frame (str): Time frame label (e.g. "today")
+            fetch (callable): Coroutine function that fetches the events
+            
+        Returns:
+            str: Formatted events, or "" if there are none
+            
+        Raises:
+            Exception: Whatever fetch() raised, e.g. RuntimeError on failed authentication
+        """
+        key = (user_id, time_frame)
+        entry = self._calendar_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        
+        # A failed fetch raises here, so it never reaches the cache
+        events = await fetch()
+        events_text = self.calendar.format_events_list(events) if events else ""
+        self._calendar_cache[key] = (time.monotonic() + _CALENDAR_CACHE_TTL, events_text)
+        return events_text
+    
+    def invalidate_calendar_cache(self, user_id: Optional[str] = None):
+        """
+        Drop cached event listings so the next calendar query refetches.
+        
+        Args:
+            user_id (str, optional): Only drop this user's listings
+        """
+        if user_id is None:
+            self._calendar_cache.clear()
+        else:
+            for key in [k for k in self._calendar_cache if k[0] == user_id]:
+                del self._calendar_cache[key]
+    
+    async def _handle_memory_storage(self, user_id: str, message: str) -> str:
         """
         Store information from the user message into memory.
         
@@ -194,7 +403,8 @@ When you learn new information about a student, acknowledge that you'll remember
         """
         try:
             # Store the memory
-            result = self.memory_manager.add_memory(
+            result = await asyncio.to_thread(
+                self.memory_manager.add_memory,
                 user_id=user_id,
                 message=message,
                 metadata={"category": "user_preference", "source": "conversation"}
@@ -208,7 +418,7 @@ When you learn new information about a student, acknowledge that you'll remember
         except Exception as e:
             return f"I had trouble storing that information: {str(e)}"
     
-    def _handle_memory_recall(self, user_id: str, message: str) -> str:
+    async def _handle_memory_recall(self, user_id: str, message: str) -> str:
         """
         Recall and present stored memories.
         
@@ -220,7 +430,7 @@ When you learn new information about a student, acknowledge that you'll remember
             str: Memory information
         """
         try:
-            memories = self.memory_manager.get_memories(user_id, limit=10)
+            memories = await asyncio.to_thread(self.memory_manager.get_memories, user_id, limit=10)
             
             if not memories:
                 return "I don't have any stored information about you yet. Feel free to share your preferences, and I'll remember them!"
@@ -236,9 +446,35 @@ When you learn new information about a student, acknowledge that you'll remember
         except Exception as e:
             return f"I had trouble retrieving your information: {str(e)}"
     
-    def _generate_ai_response(self, user_id: str, message: str, context: str = "") -> str:
+    async def _create_completion(self, messages: List[Dict[str, str]], stream: bool = False):
+        """
+        Call the chat completions API, retrying rate limits, timeouts and
+        connection errors with exponential backoff.
+        
+        Args:
+            messages (list): Chat messages for the API
+            stream (bool): Request a stream of chunks instead of a full completion
+            
+        Returns:
+            ChatCompletion or AsyncStream: The API response
+        """
+        for attempt in range(_OPENAI_MAX_ATTEMPTS):
+            try:
+                return await self.client.chat.completions.create(
+                    model=_CHAT_MODEL,
+                    messages=messages,
+                    temperature=0.7,
+                    max_tokens=500,
+                    stream=stream
+                )
+            except _RETRYABLE_OPENAI_ERRORS:
+                if attempt == _OPENAI_MAX_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(_OPENAI_BASE_DELAY * 2 ** attempt)
+    
+    async def _build_messages(self, user_id: str, message: str, context: str = "") -> List[Dict[str, str]]:
         """
-        Generate a response using OpenAI's API with context.
+        Assemble the chat messages for a completion request.
         
         Args:
             user_id (str): User ID
@@ -246,95 +482,241 @@ When you learn new information about a student, acknowledge that you'll remember
             context (str): Additional context
             
         Returns:
-            str: AI-generated response
+            list: Chat messages for the API
+        """
+        # Get relevant memories for context
+        memories = await self.memory_manager.asearch_memories(user_id, message, limit=3)
+        memory_context = ""
+        if memories:
+            lines = []
+            used = 0
+            for mem in memories:
+                line = f"- {mem.get('memory', '')}"
+                used += _count_tokens(line)
+                if used > _MEMORY_TOKEN_BUDGET:
+                    break
+                lines.append(line)
+            if lines:
+                memory_context = "Relevant information about the user:\n" + "\n".join(lines)
+        
+        # Most recent conversation history that fits the token budget
+        history = []
+        used = 0
+        for role_id, content, _ in reversed(self.conversation_history.get(user_id, ())):
+            used += _count_tokens(content)
+            if used > _HISTORY_TOKEN_BUDGET:
+                break
+            if _ROLES[role_id] in ['user', 'assistant']:
+                history.append({"role": _ROLES[role_id], "content": content})
+        history.reverse()
+        split = max(len(history) - _RECENT_TURNS, 0)
+        
+        # Build messages for the API. The static system prompt and older turns come
+        # first so the request prefix stays byte-identical for provider prompt caching;
+        # the per-turn memory context goes after them.
+        messages = [{"role": "system", "content": self.system_prompt}]
+        messages.extend(history[:split])
+        if memory_context:
+            messages.append({"role": "system", "content": memory_context})
+        messages.extend(history[split:])
+        
+        # Add current message with any additional context
+        current_content = message
+        if context:
+            current_content += f"\n\nAdditional context: {context}"
+        
+        messages.append({"role": "user", "content": current_content})
+        return messages
+    
+    async def _stream_ai_response(self, user_id: str, message: str, context: str = "") -> AsyncIterator[str]:
+        """
+        Generate a response using OpenAI's API, yielding text as it arrives.
+        
+        Args:
+            user_id (str): User ID
+            message (str): User message
+            context (str): Additional context
+            
+        Yields:
+            str: Pieces of the AI-generated response
         """
         if not self.client:
-            return "I'm currently unable to generate responses. Please check the OpenAI API configuration."
+            yield "I'm currently unable to generate responses. Please check the OpenAI API configuration."
+            return
         
         try:
-            # Get relevant memories for context
-            memories = self.memory_manager.search_memories(user_id, message, limit=3)
-            memory_context = ""
-            if memories:
-                memory_context = "\n\nRelevant information about the user:\n"
-                for mem in memories:
-                    memory_context += f"- {mem.get('memory', '')}\n"
-            
-            # Build messages for the API
-            messages = [
-                {"role": "system", "content": self.system_prompt + memory_context}
-            ]
-            
-            # Add recent conversation history
-            history = self._get_conversation_history(user_id)[-5:]  # Last 5 messages
-            for msg in history:
-                if msg['role'] in ['user', 'assistant']:
-                    messages.append({
-                        "role": msg['role'],
-                        "content": msg['content']
-                    })
-            
-            # Add current message with any additional context
-            current_content = message
-            if context:
-                current_content += f"\n\nAdditional context: {context}"
-            
-            messages.append({"role": "user", "content": current_content})
-            
-            # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=messages,
-                temperature=0.7,
-                max_tokens=500
-            )
+            messages = await self._build_messages(user_id, message, context)
+            
+            # Serve identical requests from the response cache
+            cache_key = make_cache_key(_CHAT_MODEL, messages)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
             
-            return response.choices[0].message.content
+            # Call OpenAI API and forward deltas as they arrive
+            parts = []
+            stream = await self._create_completion(messages, stream=True)
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield delta
+            
+            if parts:
+                self.response_cache.set(cache_key, "".join(parts))
             
         except Exception as e:
-            return f"I encountered an error generating a response: {str(e)}"
+            yield f"I encountered an error generating a response: {str(e)}"
     
-    def chat(self, user_id: str, message: str) -> str:
+    async def _generate_ai_response(self, user_id: str, message: str, context: str = "") -> str:
+        """
+        Generate a complete response using OpenAI's API with context.
+        
+        Args:
+            user_id (str): User ID
+            message (str): User message
+            context (str): Additional context
+            
+        Returns:
+            str: AI-generated response
+        """
+        return "".join([part async for part in self._stream_ai_response(user_id, message, context)])
+    
+    async def achat_stream(self, user_id: str, message: str) -> AsyncIterator[str]:
         """
-        Main chat method that processes user input and generates responses.
+        Process user input and stream the chatbot's response as it is generated.
+        The full response is added to the conversation history once complete.
         
         Args:
             user_id (str): Unique user identifier
             message (str): User's message
             
-        Returns:
-            str: Chatbot's response
+        Yields:
+            str: Pieces of the chatbot's response
         """
         # Add user message to history
         self._add_to_history(user_id, "user", message)
         
         # Detect intent
         intent = self._detect_intent(message)
+        parts: List[str] = []
+        stream = None
+        first = None
         
-        # Route to appropriate handler
-        if intent == 'calendar_query':
-            response = self._handle_calendar_query(user_id, message)
-        elif intent == 'store_memory':
-            # Store the memory
-            memory_response = self._handle_memory_storage(user_id, message)
-            # Also generate a conversational response
-            ai_response = self._generate_ai_response(user_id, message)
-            response = memory_response + "\n\n" + ai_response
-        elif intent == 'recall_memory':
-            response = self._handle_memory_recall(user_id, message)
+        # Memory lookups made before the first piece is yielded share one request-scoped
+        # cache. The scope must not span a yield: the generator may be resumed or closed
+        # in another context, where resetting the context variable fails.
+        with request_scope():
+            # Route to appropriate handler
+            if intent == 'calendar_query':
+                parts.append(await self._handle_calendar_query(user_id, message))
+            elif intent == 'recall_memory':
+                parts.append(await self._handle_memory_recall(user_id, message))
+            else:
+                if intent == 'store_memory':
+                    # Store the memory while the conversational response is being generated;
+                    # the task keeps the scope's cache, and its confirmation still comes
+                    # first in the reply
+                    storage = asyncio.create_task(self._handle_memory_storage(user_id, message))
+                # General conversation; the first step builds the prompt from memory
+                stream = self._stream_ai_response(user_id, message)
+                first = await anext(stream, None)
+        
+        if stream is None:
+            yield parts[-1]
         else:
-            # General conversation
-            response = self._generate_ai_response(user_id, message)
+            if intent == 'store_memory':
+                parts.append(await storage + "\n\n")
+                yield parts[0]
+            if first is not None:
+                parts.append(first)
+                yield first
+                async for piece in stream:
+                    parts.append(piece)
+                    yield piece
         
         # Add assistant response to history
-        self._add_to_history(user_id, "assistant", response)
+        self._add_to_history(user_id, "assistant", "".join(parts))
+    
+    async def achat(self, user_id: str, message: str) -> str:
+        """
+        Main chat coroutine that processes user input and generates responses.
+        
+        Args:
+            user_id (str): Unique user identifier
+            message (str): User's message
+            
+        Returns:
+            str: Chatbot's response
+        """
+        return "".join([part async for part in self.achat_stream(user_id, message)])
+    
+    def chat(self, user_id: str, message: str) -> str:
+        """
+        Synchronous entry point for chat(); runs achat() on the background loop.
+        
+        Args:
+            user_id (str): Unique user identifier
+            message (str): User's message
+            
+        Returns:
+            str: Chatbot's response
+        """
+        return self._run_sync(self.achat(user_id, message))
+    
+    def chat_stream(self, user_id: str, message: str) -> Iterator[str]:
+        """
+        Synchronous streaming entry point; yields pieces of the response from
+        achat_stream() as the background loop produces them.
+        
+        Args:
+            user_id (str): Unique user identifier
+            message (str): User's message
+            
+        Yields:
+            str: Pieces of the chatbot's response
+        """
+        chunks: "queue.Queue" = queue.Queue()
+        done = object()
+        
+        async def pump():
+            try:
+                async for piece in self.achat_stream(user_id, message):
+                    chunks.put(piece)
+            finally:
+                chunks.put(done)
         
-        return response
+        future = asyncio.run_coroutine_threadsafe(pump(), self._ensure_loop())
+        while True:
+            piece = chunks.get()
+            if piece is done:
+                break
+            yield piece
+        future.result()
+    
+    async def aclose(self):
+        """Close the pooled HTTP connections used by the OpenAI client."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
+    def close(self):
+        """Close HTTP connections and stop the background event loop."""
+        if self._loop is None:
+            return
+        self._run_sync(self.aclose())
+        with self._loop_lock:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
     
     def reset_conversation(self, user_id: str):
         """Reset conversation history for a user."""
         if user_id in self.conversation_history:
-            self.conversation_history[user_id] = []
+            self.conversation_history[user_id].clear()
+            self._archive_pending.pop(user_id, None)
             print(f"✅ Conversation reset for user {user_id}")
     
     def get_statistics(self, user_id: str) -> Dict[str, Any]:
@@ -347,14 +729,14 @@ When you learn new information about a student, acknowledge that you'll remember
         Returns:
             dict: Statistics dictionary
         """
-        history = self._get_conversation_history(user_id)
+        history = self.conversation_history.get(user_id, ())
         memories = self.memory_manager.get_memories(user_id)
         
         return {
             "total_messages": len(history),
             "stored_memories": len(memories),
-            "conversation_started": history[0]['timestamp'] if history else None,
-            "last_interaction": history[-1]['timestamp'] if history else None
+            "conversation_started": datetime.fromtimestamp(history[0][2]).isoformat() if history else None,
+            "last_interaction": datetime.fromtimestamp(history[-1][2]).isoformat() if history else None
         }
 
 
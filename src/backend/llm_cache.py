@@ -0,0 +1,111 @@
+"""
+LLM Response Cache Module
+Application-level caches for chat completion responses, so repeated prompts
+are answered without another round trip to the LLM provider.
+
+Citations:
+- LangChain LLM caching: https://python.langchain.com/docs/modules/model_io/llms/llm_caching
+- Python sqlite3: https://docs.python.org/3/library/sqlite3.html
+"""
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from src.utils.helpers import json_dumps
+
+
+def make_cache_key(model: str, messages: List[Dict[str, Any]]) -> str:
+    """
+    Compute a stable cache key for a chat completion request.
+    
+    Args:
+        model (str): Model name
+        messages (list): Chat messages sent to the API
+    
+    Returns:
+        str: Hex digest identifying the request
+    """
+    payload = json_dumps({"model": model, "messages": messages}, sort_keys=True)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class InMemoryCache:
+    """
+    Process-local LRU cache of LLM responses. Suitable for development and
+    single-process deployments.
+    """
+    
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initialize the in-memory cache.
+        
+        Args:
+            maxsize (int): Maximum number of cached responses
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: str):
+        """Store a response, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache:
+    """
+    LLM response cache persisted in a SQLite database, shared across
+    processes and restarts.
+    """
+    
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Initialize the SQLite cache.
+        
+        Args:
+            db_path (str or Path): Database file (e.g. config.DB_PATH)
+        """
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+            )
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT response FROM llm_cache WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def set(self, key: str, value: str):
+        """Store a response, replacing any existing entry."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response) VALUES (?, ?)", (key, value)
+            )
+    
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache")
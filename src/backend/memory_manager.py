@@ -8,11 +8,186 @@ Citation:
 """
 
 import os
-from typing import List, Dict, Optional, Any
+import copy
+import time
+import logging
+import functools
+import asyncio
+import threading
+from typing import List, Dict, Optional, Any, Tuple, Union
+from collections import OrderedDict
 from datetime import datetime
-import json
+import uuid
+import tempfile
+from contextlib import contextmanager
+from contextvars import ContextVar
+import numpy as np
 from mem0 import Memory
 
+from src.utils.helpers import json_dumps, json_loads
+
+try:
+    from openai import OpenAI
+except ImportError:
+    OpenAI = None
+
+# Optional: Qdrant models for tuning the collection Mem0 creates
+try:
+    from qdrant_client import models as qdrant_models
+except ImportError:
+    qdrant_models = None
+
+logger = logging.getLogger(__name__)
+
+# Messages sent to Mem0 per add() call when adding memories in bulk
+_ADD_BATCH_SIZE = 50
+
+# OpenAI Batch API ingestion: vector store insert size and status polling backoff
+_VECTOR_INSERT_CHUNK = 256
+_BATCH_POLL_INITIAL = 5.0
+_BATCH_POLL_MAX = 300.0
+_BATCH_TERMINAL_STATES = ("completed", "failed", "expired", "cancelled")
+
+# int8 scalar quantization for stored embeddings; Qdrant rescores top hits with the
+# original vectors, which are kept on disk while the quantized copy stays in RAM
+_QUANTIZATION_QUANTILE = 0.99
+
+# HNSW graph parameters for the Qdrant collection. Below roughly 10,000 vectors
+# Qdrant answers with an exact full scan instead of walking the graph.
+_HNSW_M = 32
+_HNSW_EF_CONSTRUCT = 80
+_HNSW_FULL_SCAN_VECTORS = 10_000
+
+# Seconds a search result stays valid; writes for the same user invalidate earlier
+_SEARCH_CACHE_TTL = 60.0
+
+# Maximum cached searches per manager; least recently used entries are evicted first
+_SEARCH_CACHE_SIZE = 1024
+
+# Embeddings kept per distinct text (and embed arguments) for each Mem0 instance
+_EMBED_CACHE_SIZE = 2048
+
+# Search results shared by all lookups made while handling one chat request
+_request_cache: ContextVar[Optional[Dict[Tuple[str, str, int], List[Dict[str, Any]]]]] = ContextVar(
+    "memory_request_cache", default=None
+)
+
+
+@contextmanager
+def request_scope():
+    """
+    Deduplicate search_memories calls made inside the with-block (including
+    worker threads and tasks started from it). The cache is discarded on exit.
+    """
+    token = _request_cache.set({})
+    try:
+        yield
+    finally:
+        _request_cache.reset(token)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_memory(config_json: bytes) -> Memory:
+    """
+    Create a Mem0 Memory for a serialized configuration, once per process.
+    Managers sharing a configuration reuse the same vector store and embedding clients.
+    
+    Args:
+        config_json (bytes): Mem0 configuration as JSON with sorted keys
+        
+    Returns:
+        Memory: Shared Mem0 instance
+    """
+    config = json_loads(config_json)
+    memory = Memory.from_config(config)
+    _cache_embeddings(memory)
+    if config.get("vector_store", {}).get("provider") == "qdrant":
+        store_config = config["vector_store"]["config"]
+        _tune_collection(memory, store_config["collection_name"], store_config.get("embedding_model_dims", 768))
+    return memory
+
+
+def _cache_embeddings(memory: Memory):
+    """
+    Memoize the embedder of a Mem0 instance, so texts that are stored or
+    searched repeatedly are embedded once. Mem0 calls its embedder internally
+    from add() and search(), so the cache wraps the embedder's embed method.
+    
+    Args:
+        memory (Memory): Mem0 instance
+    """
+    embedder = getattr(memory, "embedding_model", None)
+    if embedder is None:
+        return
+    embed = embedder.embed
+    
+    @functools.lru_cache(maxsize=_EMBED_CACHE_SIZE)
+    def _embed_cached(text: str, args: Tuple, kwargs: Tuple) -> Tuple[float, ...]:
+        return tuple(embed(text, *args, **dict(kwargs)))
+    
+    def cached_embed(text, *args, **kwargs):
+        # Fresh list per call; callers may modify the vector they get back
+        return list(_embed_cached(text, args, tuple(sorted(kwargs.items()))))
+    
+    cached_embed.cache_info = _embed_cached.cache_info
+    cached_embed.cache_clear = _embed_cached.cache_clear
+    embedder.embed = cached_embed
+
+
+def _tune_collection(memory: Memory, collection_name: str, dims: int):
+    """
+    Enable int8 scalar quantization on a Mem0 Qdrant collection, move the
+    full-precision vectors to disk and set the HNSW index parameters. Mem0's
+    config has no options for these, so the collection is updated after Mem0
+    has created it.
+    
+    Args:
+        memory (Memory): Mem0 instance backed by Qdrant
+        collection_name (str): Collection to update
+        dims (int): Embedding dimensions, used to size the full-scan threshold
+    """
+    if qdrant_models is None:
+        return
+    try:
+        memory.vector_store.client.update_collection(
+            collection_name=collection_name,
+            vectors_config={"": qdrant_models.VectorParamsDiff(on_disk=True)},
+            hnsw_config=qdrant_models.HnswConfigDiff(
+                m=_HNSW_M,
+                ef_construct=_HNSW_EF_CONSTRUCT,
+                # Qdrant's threshold is in KB of float32 vectors
+                full_scan_threshold=_HNSW_FULL_SCAN_VECTORS * dims * 4 // 1024
+            ),
+            quantization_config=qdrant_models.ScalarQuantization(
+                scalar=qdrant_models.ScalarQuantizationConfig(
+                    type=qdrant_models.ScalarType.INT8,
+                    quantile=_QUANTIZATION_QUANTILE,
+                    always_ram=True
+                )
+            )
+        )
+    except Exception as e:
+        print(f"⚠️  Could not tune vector collection {collection_name}: {e}")
+
+
+class MemoryBatch:
+    """Memories buffered by MemoryManager.batched(), written when the block exits."""
+    
+    def __init__(self):
+        self.items: List[Tuple[str, Optional[Dict]]] = []
+        self.results: List[Dict[str, Any]] = []
+    
+    def add(self, message: str, metadata: Optional[Dict] = None):
+        """
+        Queue a memory for the batch.
+        
+        Args:
+            message (str): Memory content to store
+            metadata (dict, optional): Additional metadata for this memory
+        """
+        self.items.append((message, metadata))
+
+
 class MemoryManager:
     """
     Manages student memories using Mem0 library.
@@ -25,7 +200,8 @@ class MemoryManager:
         
         Args:
             api_key (str, optional): Mem0 API key
-            config (dict, optional): Custom Mem0 configuration
+            config (dict, optional): Custom Mem0 configuration; copied, so
+                the caller's dict (e.g. config.MEM0_CONFIG) is never modified
             
         Citation: Mem0 initialization - https://docs.mem0.ai/quickstart
         """
@@ -33,12 +209,12 @@ class MemoryManager:
         
         # Default configuration for Mem0
         # Citation: Mem0 configuration options - https://docs.mem0.ai/configuration
-        self.config = config or {
+        self.config = copy.deepcopy(config) if config else {
             "vector_store": {
                 "provider": "qdrant",
                 "config": {
                     "collection_name": "student_memories",
-                    "embedding_model_dims": 1536,
+                    "embedding_model_dims": 768,
                 }
             },
             "llm": {
@@ -52,26 +228,47 @@ class MemoryManager:
             "embedder": {
                 "provider": "openai",
                 "config": {
-                    "model": "text-embedding-ada-002"
+                    "model": "text-embedding-3-small",
+                    "embedding_dims": 768
                 }
             }
         }
         
+        # Bounded LRU/TTL cache of search results keyed by (user_id, query, limit)
+        self._search_cache: "OrderedDict[Tuple[str, str, int], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+        
         # Initialize Mem0 Memory instance
         try:
-            self.memory = Memory.from_config(self.config)
+            self.memory = _build_memory(json_dumps(self.config, sort_keys=True))
             print("✅ Memory Manager initialized successfully")
         except Exception as e:
             print(f"❌ Error initializing Memory Manager: {e}")
             self.memory = None
     
-    def add_memory(self, user_id: str, message: str, metadata: Optional[Dict] = None) -> Dict[str, Any]:
+    def _invalidate_search_cache(self, user_id: Optional[str] = None):
+        """
+        Drop cached search results for a user, or for everyone if user_id is None.
+        
+        Args:
+            user_id (str, optional): User whose cached searches are stale
+        """
+        request_cache = _request_cache.get()
+        with self._search_cache_lock:
+            for cache in (self._search_cache, request_cache or {}):
+                if user_id is None:
+                    cache.clear()
+                else:
+                    for key in [k for k in cache if k[0] == user_id]:
+                        del cache[key]
+    
+    def add_memory(self, user_id: str, message: Union[str, List[Dict[str, str]]], metadata: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Add a new memory for a user.
         
         Args:
             user_id (str): Unique identifier for the user
-            message (str): Memory content to store
+            message (str or list): Memory content to store, or chat messages to extract memories from
             metadata (dict, optional): Additional metadata
             
         Returns:
@@ -86,7 +283,7 @@ class MemoryManager:
             # Add timestamp to metadata
             if metadata is None:
                 metadata = {}
-            metadata['timestamp'] = datetime.now().isoformat()
+            metadata['timestamp'] = time.time()
             
             # Add memory using Mem0
             result = self.memory.add(
@@ -94,8 +291,9 @@ class MemoryManager:
                 user_id=user_id,
                 metadata=metadata
             )
+            self._invalidate_search_cache(user_id)
             
-            print(f"✅ Memory added for user {user_id}: {message[:50]}...")
+            logger.debug("Memory added for user %s: %.50s...", user_id, message)
             return {
                 "success": True,
                 "result": result,
@@ -109,6 +307,223 @@ class MemoryManager:
                 "error": str(e)
             }
     
+    async def aadd_memory(self, user_id: str, message: Union[str, List[Dict[str, str]]], metadata: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Awaitable add_memory; runs the write in a worker thread.
+        
+        Args:
+            user_id (str): Unique identifier for the user
+            message (str or list): Memory content, or chat messages to extract memories from
+            metadata (dict, optional): Additional metadata
+            
+        Returns:
+            dict: Result of the memory addition operation
+        """
+        return await asyncio.to_thread(self.add_memory, user_id, message, metadata)
+    
+    def add_memories_batch(self, user_id: str, messages: List[str], metadata: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Add several memories for a user, sending up to 50 messages per Mem0 call
+        so embedding and vector store writes are amortized across the batch.
+        
+        Args:
+            user_id (str): Unique identifier for the user
+            messages (list): Memory contents to store
+            metadata (dict, optional): Metadata shared by every memory in the batch
+            
+        Returns:
+            dict: Result of the batch addition
+        """
+        try:
+            if not self.memory:
+                return {"error": "Memory system not initialized"}
+            
+            metadata = dict(metadata or {}, timestamp=time.time())
+            results = [
+                self.memory.add(
+                    messages=[{"role": "user", "content": m} for m in messages[i:i + _ADD_BATCH_SIZE]],
+                    user_id=user_id,
+                    metadata=metadata
+                )
+                for i in range(0, len(messages), _ADD_BATCH_SIZE)
+            ]
+            self._invalidate_search_cache(user_id)
+            
+            logger.debug("Added %d memories for user %s in %d batch(es)", len(messages), user_id, len(results))
+            return {
+                "success": True,
+                "result": results,
+                "message": f"{len(messages)} memories stored successfully"
+            }
+            
+        except Exception as e:
+            print(f"❌ Error adding memories: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    @contextmanager
+    def batched(self, user_id: str):
+        """
+        Collect memories inside a with-block and store them on exit with one
+        add_memories_batch call per distinct metadata, instead of one Mem0 call
+        per memory. Nothing is stored if the block raises.
+        
+        Args:
+            user_id (str): Unique identifier for the user
+            
+        Yields:
+            MemoryBatch: Buffer to add memories to; its results are set on exit
+        """
+        batch = MemoryBatch()
+        yield batch
+        
+        groups: Dict[bytes, Tuple[Optional[Dict], List[str]]] = {}
+        for message, metadata in batch.items:
+            key = json_dumps(metadata or {}, sort_keys=True)
+            groups.setdefault(key, (metadata, []))[1].append(message)
+        batch.results = [
+            self.add_memories_batch(user_id, messages, metadata)
+            for metadata, messages in groups.values()
+        ]
+    
+    async def aadd_memories_batch(self, user_id: str, messages: List[str], metadata: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Awaitable add_memories_batch; chunks of 50 messages are added concurrently.
+        
+        Args:
+            user_id (str): Unique identifier for the user
+            messages (list): Memory contents to store
+            metadata (dict, optional): Metadata shared by every memory in the batch
+            
+        Returns:
+            dict: Result of the batch addition
+        """
+        chunks = [messages[i:i + _ADD_BATCH_SIZE] for i in range(0, len(messages), _ADD_BATCH_SIZE)]
+        outcomes = await asyncio.gather(*(
+            asyncio.to_thread(self.add_memories_batch, user_id, chunk, metadata) for chunk in chunks
+        ))
+        failed = [o for o in outcomes if not o.get('success')]
+        if failed:
+            return failed[0]
+        return {
+            "success": True,
+            "result": [r for o in outcomes for r in o['result']],
+            "message": f"{len(messages)} memories stored successfully"
+        }
+    
+    def bulk_add_memories_batch_api(
+        self,
+        user_id: str,
+        messages: List[str],
+        metadata: Optional[Dict] = None,
+        timeout: float = 24 * 3600
+    ) -> Dict[str, Any]:
+        """
+        Embed memories through the OpenAI Batch API and insert them into the vector store.
+        Intended for offline ingestion (bootstrapping a user, re-embedding); the batch can
+        take up to 24 hours, so interactive code should keep using add_memory.
+        
+        Memories are stored verbatim; Mem0's LLM fact extraction is skipped.
+        
+        Args:
+            user_id (str): Unique identifier for the user
+            messages (list): Memory contents to store
+            metadata (dict, optional): Metadata shared by every memory
+            timeout (float): Seconds to wait for the batch to finish
+            
+        Returns:
+            dict: Result of the bulk ingestion
+            
+        Citation: OpenAI Batch API - https://platform.openai.com/docs/guides/batch
+        """
+        try:
+            if not self.memory:
+                return {"error": "Memory system not initialized"}
+            if OpenAI is None:
+                return {"error": "OpenAI library not installed"}
+            
+            client = OpenAI()
+            embedder = self.config["embedder"]["config"]
+            body = {"model": embedder["model"]}
+            if embedder.get("embedding_dims"):
+                body["dimensions"] = embedder["embedding_dims"]
+            
+            # Write one embeddings request per memory and upload the file
+            with tempfile.NamedTemporaryFile("wb", suffix=".jsonl", delete=False) as f:
+                for i, text in enumerate(messages):
+                    f.write(json_dumps({
+                        "custom_id": f"mem-{i}",
+                        "method": "POST",
+                        "url": "/v1/embeddings",
+                        "body": dict(body, input=text)
+                    }) + b"\n")
+                path = f.name
+            try:
+                with open(path, "rb") as f:
+                    input_file = client.files.create(file=f, purpose="batch")
+            finally:
+                os.remove(path)
+            
+            batch = client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/embeddings",
+                completion_window="24h"
+            )
+            print(f"⏳ Submitted embedding batch {batch.id} with {len(messages)} memories")
+            
+            # Poll with exponential backoff until the batch reaches a terminal state
+            deadline = time.monotonic() + timeout
+            delay = _BATCH_POLL_INITIAL
+            while batch.status not in _BATCH_TERMINAL_STATES:
+                if time.monotonic() > deadline:
+                    return {"success": False, "error": f"Batch {batch.id} timed out", "batch_id": batch.id}
+                time.sleep(delay)
+                delay = min(delay * 2, _BATCH_POLL_MAX)
+                batch = client.batches.retrieve(batch.id)
+            
+            if batch.status != "completed":
+                return {"success": False, "error": f"Batch {batch.id} {batch.status}", "batch_id": batch.id}
+            
+            # Collect embeddings by request index
+            embeddings = {}
+            for line in client.files.content(batch.output_file_id).text.splitlines():
+                record = json_loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") == 200:
+                    embeddings[int(record["custom_id"].split("-", 1)[1])] = response["body"]["data"][0]["embedding"]
+            
+            # Bulk insert into the vector store
+            created_at = time.time()
+            indices = sorted(embeddings)
+            for start in range(0, len(indices), _VECTOR_INSERT_CHUNK):
+                chunk = indices[start:start + _VECTOR_INSERT_CHUNK]
+                self.memory.vector_store.insert(
+                    vectors=[embeddings[i] for i in chunk],
+                    ids=[str(uuid.uuid4()) for _ in chunk],
+                    payloads=[
+                        dict(metadata or {}, data=messages[i], user_id=user_id, timestamp=created_at)
+                        for i in chunk
+                    ]
+                )
+            self._invalidate_search_cache(user_id)
+            
+            print(f"✅ Bulk added {len(indices)}/{len(messages)} memories for user {user_id}")
+            return {
+                "success": True,
+                "batch_id": batch.id,
+                "added": len(indices),
+                "failed": len(messages) - len(indices)
+            }
+            
+        except Exception as e:
+            print(f"❌ Error bulk adding memories: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
     def get_memories(self, user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Retrieve all memories for a specific user.
@@ -129,7 +544,7 @@ class MemoryManager:
             # Retrieve memories for the user
             memories = self.memory.get_all(user_id=user_id, limit=limit)
             
-            print(f"✅ Retrieved {len(memories)} memories for user {user_id}")
+            logger.debug("Retrieved %d memories for user %s", len(memories), user_id)
             return memories
             
         except Exception as e:
@@ -154,20 +569,137 @@ class MemoryManager:
             if not self.memory:
                 return []
             
+            # Repeated searches within a request or the TTL skip the embedding and vector lookup
+            key = (user_id, query, limit)
+            request_cache = _request_cache.get()
+            if request_cache is not None and key in request_cache:
+                return request_cache[key]
+            with self._search_cache_lock:
+                entry = self._search_cache.get(key)
+                if entry is not None:
+                    if time.monotonic() - entry[0] < _SEARCH_CACHE_TTL:
+                        self._search_cache.move_to_end(key)
+                    else:
+                        del self._search_cache[key]
+                        entry = None
+            if entry is not None:
+                if request_cache is not None:
+                    request_cache[key] = entry[1]
+                return entry[1]
+            
             # Search memories using semantic similarity
             results = self.memory.search(
                 query=query,
                 user_id=user_id,
                 limit=limit
             )
-            
-            print(f"✅ Found {len(results)} memories matching query: {query[:30]}...")
+            now = time.monotonic()
+            with self._search_cache_lock:
+                cache = self._search_cache
+                cache[key] = (now, results)
+                cache.move_to_end(key)
+                # Drop expired entries from the least recently used end, then enforce the size bound
+                while cache:
+                    oldest_key, (stored_at, _) = next(iter(cache.items()))
+                    if now - stored_at < _SEARCH_CACHE_TTL and len(cache) <= _SEARCH_CACHE_SIZE:
+                        break
+                    del cache[oldest_key]
+            if request_cache is not None:
+                request_cache[key] = results
+            
+            logger.debug("Found %d memories matching query: %.30s...", len(results), query)
             return results
             
         except Exception as e:
             print(f"❌ Error searching memories: {e}")
             return []
     
+    def rerank(
+        self,
+        query_embedding: Any,
+        candidates: List[Dict[str, Any]],
+        limit: Optional[int] = None,
+        normalized: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Re-rank candidate memories by cosine similarity to a query embedding.
+        Similarities are computed in one matrix-vector product.
+        
+        Args:
+            query_embedding (array-like): Embedding of the query
+            candidates (list): Memories with an 'embedding' field
+            limit (int, optional): Maximum number of results
+            normalized (bool): Set when all vectors already have unit length (OpenAI
+                embeddings and vectors read from a cosine Qdrant collection do);
+                cosine similarity is then the plain inner product
+            
+        Returns:
+            list: Candidates ordered by similarity, each with a 'score' field
+        """
+        if not candidates:
+            return []
+        
+        matrix = np.asarray([c['embedding'] for c in candidates], dtype=np.float32)
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if not normalized:
+            matrix = matrix / np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+            query = query / max(float(np.linalg.norm(query)), 1e-12)
+        
+        scores = matrix @ query
+        order = np.argsort(-scores, kind='stable')[:limit]
+        return [dict(candidates[i], score=float(scores[i])) for i in order]
+    
+    def search_by_vector(self, user_id: str, vector: Any, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Search a user's memories with a precomputed query embedding, skipping
+        the embedding call made by search_memories.
+        
+        Args:
+            user_id (str): Unique identifier for the user
+            vector (array-like): Query embedding (embedding_model_dims values)
+            limit (int): Maximum number of results
+            
+        Returns:
+            list: Matching memories with 'id', 'memory', 'score' and 'metadata'
+        """
+        try:
+            if not self.memory:
+                return []
+            
+            hits = self.memory.vector_store.search(
+                query=np.asarray(vector, dtype=np.float32).tolist(),
+                limit=limit,
+                filters={"user_id": user_id}
+            )
+            return [
+                {
+                    "id": str(hit.id),
+                    "memory": hit.payload.get("data"),
+                    "score": hit.score,
+                    "metadata": hit.payload
+                }
+                for hit in hits
+            ]
+            
+        except Exception as e:
+            print(f"❌ Error searching memories by vector: {e}")
+            return []
+    
+    async def asearch_memories(self, user_id: str, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Awaitable search_memories; runs the search in a worker thread so it can
+        overlap with other I/O.
+        
+        Args:
+            user_id (str): Unique identifier for the user
+            query (str): Search query
+            limit (int): Maximum number of results
+            
+        Returns:
+            list: List of relevant memories
+        """
+        return await asyncio.to_thread(self.search_memories, user_id, query, limit)
+    
     def update_memory(self, memory_id: str, data: str) -> Dict[str, Any]:
         """
         Update an existing memory.
@@ -190,6 +722,7 @@ class MemoryManager:
                 memory_id=memory_id,
                 data=data
             )
+            self._invalidate_search_cache()
             
             print(f"✅ Memory {memory_id} updated successfully")
             return {
@@ -222,6 +755,7 @@ class MemoryManager:
             
             # Delete the memory
             self.memory.delete(memory_id=memory_id)
+            self._invalidate_search_cache()
             
             print(f"✅ Memory {memory_id} deleted successfully")
             return {
@@ -252,6 +786,7 @@ class MemoryManager:
             
             # Delete all memories for the user
             self.memory.delete_all(user_id=user_id)
+            self._invalidate_search_cache(user_id)
             
             print(f"✅ All memories deleted for user {user_id}")
             return {
@@ -266,6 +801,38 @@ class MemoryManager:
                 "error": str(e)
             }
     
+    def replace_memories(self, user_id: str, messages: List[str], metadata: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Replace all memories of a user with new ones: one delete_all call followed
+        by batched adds, without per-memory round trips. Mem0 has no transactions,
+        so if adding fails the user keeps only the memories added before the error.
+        
+        Args:
+            user_id (str): Unique identifier for the user
+            messages (list): New memory contents
+            metadata (dict, optional): Metadata shared by every new memory
+            
+        Returns:
+            dict: Result of the replacement
+        """
+        try:
+            if not self.memory:
+                return {"error": "Memory system not initialized"}
+            
+            self.memory.delete_all(user_id=user_id)
+            self._invalidate_search_cache(user_id)
+            if not messages:
+                return {"success": True, "result": [], "message": f"All memories deleted for user {user_id}"}
+            
+            return self.add_memories_batch(user_id, messages, metadata)
+            
+        except Exception as e:
+            print(f"❌ Error replacing memories: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
     def get_memory_summary(self, user_id: str) -> str:
         """
         Get a formatted summary of all user memories.
@@ -288,7 +855,10 @@ class MemoryManager:
             for i, mem in enumerate(memories, 1):
                 summary += f"{i}. {mem.get('memory', 'N/A')}\n"
                 if 'metadata' in mem:
-                    summary += f"   Timestamp: {mem['metadata'].get('timestamp', 'N/A')}\n"
+                    timestamp = mem['metadata'].get('timestamp', 'N/A')
+                    if isinstance(timestamp, (int, float)):
+                        timestamp = datetime.fromtimestamp(timestamp).isoformat()
+                    summary += f"   Timestamp: {timestamp}\n"
                 summary += "\n"
             
             return summary
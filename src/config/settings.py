@@ -6,50 +6,108 @@ All API keys and sensitive data should be stored in .env file.
 """
 
 import os
+import logging
+import logging.handlers
+import functools
+from dataclasses import dataclass, field, fields, MISSING
 from pathlib import Path
-from dotenv import load_dotenv
+from typing import Any, Dict, Optional, Tuple
 
-# Load environment variables from .env file
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-# Base directories
-BASE_DIR = Path(__file__).parent.parent.parent
-DATA_DIR = BASE_DIR / 'data'
-LOGS_DIR = BASE_DIR / 'logs'
+# Snapshot of the environment; settings are resolved from this dict rather than os.getenv.
+# Refreshed by get_config() once the .env file has been loaded.
+_ENV = dict(os.environ)
 
-# Create directories if they don't exist
-DATA_DIR.mkdir(exist_ok=True)
-LOGS_DIR.mkdir(exist_ok=True)
 
+def _g(key: str, default=None, cast=str):
+    """
+    Read a setting from the environment snapshot.
+    
+    Args:
+        key (str): Environment variable name
+        default: Value used when the variable is unset
+        cast (callable): Conversion applied to the value (e.g. int, float)
+        
+    Returns:
+        The (converted) value, or None if unset without a default
+    """
+    value = _ENV.get(key, default)
+    return cast(value) if value is not None and cast is not str else value
 
-class Config:
-    """Main configuration class."""
+
+def _mtime_or_none(path: Path) -> Optional[float]:
+    """Return a file's modification time, or None if it does not exist."""
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _validate_impl(key: Tuple) -> bool:
+    """
+    Check required configuration for a validation fingerprint.
     
-    # Application Settings
-    APP_NAME = os.getenv('APP_NAME', 'Student Schedule Assistant')
-    DEBUG_MODE = os.getenv('DEBUG_MODE', 'False').lower() == 'true'
+    Args:
+        key (tuple): (has OpenAI key, has Anthropic key, memory enabled, has Mem0 key,
+            calendar enabled, credentials file mtime or None)
+        
+    Returns:
+        bool: True if configuration is valid, False otherwise
+    """
+    has_openai, has_anthropic, enable_memory, has_mem0, enable_calendar, credentials_mtime = key
+    required_vars = []
     
-    # OpenAI Configuration
-    OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-    OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-4')
-    OPENAI_TEMPERATURE = float(os.getenv('OPENAI_TEMPERATURE', '0.7'))
-    OPENAI_MAX_TOKENS = int(os.getenv('OPENAI_MAX_TOKENS', '500'))
+    # Check OpenAI or Anthropic key
+    if not has_openai and not has_anthropic:
+        required_vars.append('OPENAI_API_KEY or ANTHROPIC_API_KEY')
     
-    # Anthropic Configuration (Alternative)
-    ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
-    ANTHROPIC_MODEL = os.getenv('ANTHROPIC_MODEL', 'claude-3-sonnet-20240229')
+    # Check Mem0 configuration if memory is enabled
+    if enable_memory and not has_mem0:
+        required_vars.append('MEM0_API_KEY')
     
-    # Mem0 Configuration
-    # Citation: Mem0 configuration - https://docs.mem0.ai/configuration
-    MEM0_API_KEY = os.getenv('MEM0_API_KEY')
-    MEM0_ORG_ID = os.getenv('MEM0_ORG_ID')
+    # Check Google Calendar configuration if calendar is enabled
+    if enable_calendar and credentials_mtime is None:
+        required_vars.append('credentials.json file')
+    
+    if required_vars:
+        logger.error("❌ Missing required configuration: %s", ", ".join(required_vars))
+        return False
     
-    MEM0_CONFIG = {
+    logger.info("✅ Configuration validated successfully")
+    return True
+
+
+# Base directories (created by get_config())
+BASE_DIR = Path(__file__).parent.parent.parent
+DATA_DIR = BASE_DIR / 'data'
+LOGS_DIR = BASE_DIR / 'logs'
+
+
+# Google Calendar scopes, shared by every configuration
+_GOOGLE_SCOPES = (
+    'https://www.googleapis.com/auth/calendar.readonly',
+)
+
+
+def _mem0_config(collection_name: str) -> Dict[str, Any]:
+    """
+    Build the Mem0 configuration.
+    Citation: Mem0 configuration - https://docs.mem0.ai/configuration
+    
+    Args:
+        collection_name (str): Vector store collection for the memories
+        
+    Returns:
+        dict: Mem0 configuration
+    """
+    return {
         "vector_store": {
             "provider": "qdrant",
             "config": {
-                "collection_name": os.getenv('MEM0_COLLECTION', 'student_memories'),
-                "embedding_model_dims": 1536,
+                "collection_name": collection_name,
+                "embedding_model_dims": 768,
             }
         },
         "llm": {
@@ -63,158 +121,290 @@ class Config:
         "embedder": {
             "provider": "openai",
             "config": {
-                "model": "text-embedding-ada-002"
+                "model": "text-embedding-3-small",
+                "embedding_dims": 768
             }
         }
     }
+
+
+# Field default types that can be overridden by an environment variable
+_ENV_SCALAR_TYPES = (str, bool, int, float)
+
+
+def _from_env_value(value: str, default):
+    """Convert an environment string to the type of the field's default."""
+    if isinstance(default, bool):
+        return value.lower() == 'true'
+    if isinstance(default, (int, float)):
+        return type(default)(value)
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    Main configuration. Built once by from_env(); every str, bool, int and
+    float setting can be overridden by an environment variable of the same name.
+    """
+    
+    # Application Settings
+    APP_NAME: str = 'Student Schedule Assistant'
+    DEBUG_MODE: bool = False
+    
+    # OpenAI Configuration
+    OPENAI_API_KEY: Optional[str] = None
+    OPENAI_MODEL: str = 'gpt-4'
+    OPENAI_TEMPERATURE: float = 0.7
+    OPENAI_MAX_TOKENS: int = 500
+    
+    # Anthropic Configuration (Alternative)
+    ANTHROPIC_API_KEY: Optional[str] = None
+    ANTHROPIC_MODEL: str = 'claude-3-sonnet-20240229'
+    
+    # Mem0 Configuration
+    MEM0_API_KEY: Optional[str] = None
+    MEM0_ORG_ID: Optional[str] = None
+    MEM0_CONFIG: Dict[str, Any] = field(default_factory=lambda: _mem0_config('student_memories'))
     
     # Google Calendar Configuration
     # Citation: Google OAuth - https://developers.google.com/identity/protocols/oauth2
-    GOOGLE_CLIENT_ID = os.getenv('GOOGLE_CLIENT_ID')
-    GOOGLE_CLIENT_SECRET = os.getenv('GOOGLE_CLIENT_SECRET')
-    GOOGLE_REDIRECT_URI = os.getenv('GOOGLE_REDIRECT_URI', 'http://localhost:8501')
-    
-    GOOGLE_SCOPES = [
-        'https://www.googleapis.com/auth/calendar.readonly'
-    ]
+    GOOGLE_CLIENT_ID: Optional[str] = None
+    GOOGLE_CLIENT_SECRET: Optional[str] = None
+    GOOGLE_REDIRECT_URI: str = 'http://localhost:8501'
+    GOOGLE_SCOPES: Tuple[str, ...] = _GOOGLE_SCOPES
     
     # Calendar file paths
-    CREDENTIALS_FILE = BASE_DIR / 'credentials.json'
-    TOKEN_FILE = BASE_DIR / 'token.pickle'
+    CREDENTIALS_FILE: Path = BASE_DIR / 'credentials.json'
+    TOKEN_FILE: Path = BASE_DIR / 'token.json'  # authorized-user JSON, never pickle
     
     # MCP Configuration
-    MCP_SERVER_URL = os.getenv('MCP_SERVER_URL', 'http://localhost:3000')
+    MCP_SERVER_URL: str = 'http://localhost:3000'
+    MCP_TOKEN_TTL: int = 3600  # Google access tokens last 1 hour
     
     # Database Configuration
-    DB_PATH = DATA_DIR / 'chatbot.db'
+    DB_PATH: Path = DATA_DIR / 'chatbot.db'
     
     # Logging Configuration
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-    LOG_FILE = LOGS_DIR / 'chatbot.log'
-    LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    LOG_LEVEL: str = 'INFO'
+    LOG_FILE: Path = LOGS_DIR / 'chatbot.log'
+    LOG_FORMAT: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     
     # Session Configuration
-    SESSION_SECRET = os.getenv('SESSION_SECRET', 'your-secret-key-change-in-production')
-    SESSION_TIMEOUT = int(os.getenv('SESSION_TIMEOUT', '3600'))  # 1 hour
+    SESSION_SECRET: str = 'your-secret-key-change-in-production'
+    SESSION_TIMEOUT: int = 3600  # 1 hour
     
     # Chatbot Settings
-    MAX_CONVERSATION_HISTORY = int(os.getenv('MAX_CONVERSATION_HISTORY', '10'))
-    MAX_MEMORY_RESULTS = int(os.getenv('MAX_MEMORY_RESULTS', '10'))
-    MAX_CALENDAR_EVENTS = int(os.getenv('MAX_CALENDAR_EVENTS', '50'))
+    MAX_CONVERSATION_HISTORY: int = 10
+    MAX_MEMORY_RESULTS: int = 10
+    MAX_CALENDAR_EVENTS: int = 50
     
     # Feature Flags
-    ENABLE_MEMORY = os.getenv('ENABLE_MEMORY', 'True').lower() == 'true'
-    ENABLE_CALENDAR = os.getenv('ENABLE_CALENDAR', 'True').lower() == 'true'
-    ENABLE_NLP = os.getenv('ENABLE_NLP', 'True').lower() == 'true'
+    ENABLE_MEMORY: bool = True
+    ENABLE_CALENDAR: bool = True
+    ENABLE_NLP: bool = True
     
     @classmethod
-    def validate(cls) -> bool:
+    def from_env(cls, overrides: Optional[Dict[str, Any]] = None) -> 'Config':
+        """
+        Resolve a configuration from the _ENV snapshot.
+        
+        Args:
+            overrides (dict, optional): Settings that take precedence over the
+                environment (e.g. PRODUCTION_OVERRIDES)
+            
+        Returns:
+            Config: The resolved configuration
+        """
+        # Scalar settings only; paths and structured settings (e.g. GOOGLE_SCOPES)
+        # are not read from the environment
+        values = {
+            f.name: _from_env_value(_ENV[f.name], f.default)
+            for f in fields(cls)
+            if f.name in _ENV and f.default is not MISSING
+            and (f.default is None or isinstance(f.default, _ENV_SCALAR_TYPES))
+        }
+        values['MEM0_CONFIG'] = _mem0_config(_g('MEM0_COLLECTION', 'student_memories'))
+        values.update(overrides or {})
+        return cls(**values)
+    
+    def validate(self) -> bool:
         """
         Validate that all required configuration is present.
+        The result is cached per combination of the relevant settings and the
+        credentials file's modification time.
         
         Returns:
             bool: True if configuration is valid, False otherwise
         """
-        required_vars = []
-        
-        # Check OpenAI or Anthropic key
-        if not cls.OPENAI_API_KEY and not cls.ANTHROPIC_API_KEY:
-            required_vars.append('OPENAI_API_KEY or ANTHROPIC_API_KEY')
-        
-        # Check Mem0 configuration if memory is enabled
-        if cls.ENABLE_MEMORY and not cls.MEM0_API_KEY:
-            required_vars.append('MEM0_API_KEY')
-        
-        # Check Google Calendar configuration if calendar is enabled
-        if cls.ENABLE_CALENDAR:
-            if not cls.CREDENTIALS_FILE.exists():
-                required_vars.append('credentials.json file')
-        
-        if required_vars:
-            print("❌ Missing required configuration:")
-            for var in required_vars:
-                print(f"   - {var}")
-            return False
+        return _validate_impl((
+            self.OPENAI_API_KEY is not None,
+            self.ANTHROPIC_API_KEY is not None,
+            self.ENABLE_MEMORY,
+            self.MEM0_API_KEY is not None,
+            self.ENABLE_CALENDAR,
+            _mtime_or_none(self.CREDENTIALS_FILE) if self.ENABLE_CALENDAR else None
+        ))
+    
+    @staticmethod
+    def reload_env() -> 'Config':
+        """
+        Re-read os.environ (and the .env file) and rebuild the active configuration.
+        Modules that imported `config` directly keep the previous instance; use
+        get_config() to pick up the new one.
         
-        print("✅ Configuration validated successfully")
-        return True
+        Returns:
+            Config: The rebuilt configuration
+        """
+        global _config
+        _config = None
+        config = get_config()
+        config.validate()
+        return config
     
-    @classmethod
-    def print_config(cls):
+    @staticmethod
+    def clear_validation_cache():
+        """Forget cached validate() results."""
+        _validate_impl.cache_clear()
+    
+    def print_config(self):
         """Print current configuration (excluding sensitive data)."""
         print("\n" + "="*60)
         print("CURRENT CONFIGURATION")
         print("="*60)
-        print(f"App Name: {cls.APP_NAME}")
-        print(f"Debug Mode: {cls.DEBUG_MODE}")
-        print(f"OpenAI Model: {cls.OPENAI_MODEL}")
-        print(f"Memory Enabled: {cls.ENABLE_MEMORY}")
-        print(f"Calendar Enabled: {cls.ENABLE_CALENDAR}")
-        print(f"NLP Enabled: {cls.ENABLE_NLP}")
-        print(f"Log Level: {cls.LOG_LEVEL}")
-        print(f"Max Conversation History: {cls.MAX_CONVERSATION_HISTORY}")
+        print(f"App Name: {self.APP_NAME}")
+        print(f"Debug Mode: {self.DEBUG_MODE}")
+        print(f"OpenAI Model: {self.OPENAI_MODEL}")
+        print(f"Memory Enabled: {self.ENABLE_MEMORY}")
+        print(f"Calendar Enabled: {self.ENABLE_CALENDAR}")
+        print(f"NLP Enabled: {self.ENABLE_NLP}")
+        print(f"Log Level: {self.LOG_LEVEL}")
+        print(f"Max Conversation History: {self.MAX_CONVERSATION_HISTORY}")
         print("="*60 + "\n")
 
 
-class DevelopmentConfig(Config):
-    """Development-specific configuration."""
-    DEBUG_MODE = True
-    LOG_LEVEL = 'DEBUG'
-
+# Development-specific configuration
+DEVELOPMENT_OVERRIDES = {
+    'DEBUG_MODE': True,
+    'LOG_LEVEL': 'DEBUG',
+}
 
-class ProductionConfig(Config):
-    """Production-specific configuration."""
-    DEBUG_MODE = False
-    LOG_LEVEL = 'WARNING'
+# Production-specific configuration
+PRODUCTION_OVERRIDES = {
+    'DEBUG_MODE': False,
+    'LOG_LEVEL': 'WARNING',
     
     # More restrictive settings for production
-    MAX_CONVERSATION_HISTORY = 5
-    OPENAI_TEMPERATURE = 0.5
-
+    'MAX_CONVERSATION_HISTORY': 5,
+    'OPENAI_TEMPERATURE': 0.5,
+}
 
-class TestConfig(Config):
-    """Testing-specific configuration."""
-    DEBUG_MODE = True
-    LOG_LEVEL = 'DEBUG'
+# Testing-specific configuration
+TEST_OVERRIDES = {
+    'DEBUG_MODE': True,
+    'LOG_LEVEL': 'DEBUG',
     
     # Use test database
-    DB_PATH = DATA_DIR / 'test_chatbot.db'
+    'DB_PATH': DATA_DIR / 'test_chatbot.db',
     
     # Disable external API calls in tests
-    ENABLE_MEMORY = False
-    ENABLE_CALENDAR = False
+    'ENABLE_MEMORY': False,
+    'ENABLE_CALENDAR': False,
+}
 
 
-# Determine which config to use based on environment
-ENV = os.getenv('ENVIRONMENT', 'development').lower()
+# Log file rotation and write buffering
+_LOG_MAX_BYTES = 10_000_000
+_LOG_BACKUP_COUNT = 3
+_LOG_BUFFER_CAPACITY = 256
 
-if ENV == 'production':
-    config = ProductionConfig()
-elif ENV == 'testing':
-    config = TestConfig()
-else:
-    config = DevelopmentConfig()
+# Active configuration, built on first use
+_config = None
+ENV = None
 
+# Set once logging has been configured and the configuration validated. Read
+# back from the module globals so a reload (Streamlit's file watcher,
+# importlib.reload in tests) does not repeat the setup or validation output.
+_initialized = globals().get('_initialized', False)
 
-# Logging setup
-import logging
-
-logging.basicConfig(
-    level=getattr(logging, config.LOG_LEVEL),
-    format=config.LOG_FORMAT,
-    handlers=[
-        logging.FileHandler(config.LOG_FILE),
-        logging.StreamHandler()
-    ]
-)
 
-logger = logging.getLogger(__name__)
+def _build() -> Config:
+    """
+    Load the .env file, pick the configuration for ENVIRONMENT, create the data
+    and log directories, set up logging and validate the result.
+    
+    Returns:
+        Config: The active configuration
+    """
+    global ENV, _initialized
+    
+    # Load environment variables from .env file, then refresh the snapshot
+    from dotenv import load_dotenv
+    load_dotenv()
+    _ENV.clear()
+    _ENV.update(os.environ)
+    
+    # Determine which config to use based on environment
+    ENV = _g('ENVIRONMENT', 'development').lower()
+    
+    if ENV == 'production':
+        config = Config.from_env(PRODUCTION_OVERRIDES)
+    elif ENV == 'testing':
+        config = Config.from_env(TEST_OVERRIDES)
+    else:
+        config = Config.from_env(DEVELOPMENT_OVERRIDES)
+    
+    # Create directories if they don't exist
+    DATA_DIR.mkdir(exist_ok=True)
+    LOGS_DIR.mkdir(exist_ok=True)
+    
+    if _initialized:
+        return config
+    
+    # Logging setup; skipped if the root logger is already configured
+    # File output is rotated, opened on first write and buffered in memory;
+    # the buffer is flushed when full, on ERROR records and at shutdown
+    if not logging.getLogger().hasHandlers():
+        file_handler = logging.handlers.RotatingFileHandler(
+            config.LOG_FILE,
+            maxBytes=_LOG_MAX_BYTES,
+            backupCount=_LOG_BACKUP_COUNT,
+            delay=True
+        )
+        file_handler.setFormatter(logging.Formatter(config.LOG_FORMAT))
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=_LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
+        logging.basicConfig(
+            level=getattr(logging, config.LOG_LEVEL),
+            format=config.LOG_FORMAT,
+            handlers=[
+                buffered_handler,
+                logging.StreamHandler()
+            ]
+        )
+    
+    config.validate()
+    _initialized = True
+    return config
 
 
 # Utility functions
 def get_config():
-    """Get the current configuration object."""
-    return config
+    """Get the current configuration object, building it on first use."""
+    global _config
+    if _config is None:
+        _config = _build()
+    return _config
+
+
+def __getattr__(name: str):
+    """Build the configuration lazily the first time `config` is accessed."""
+    if name == 'config':
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_logger(name: str = __name__):
@@ -233,9 +423,9 @@ def get_logger(name: str = __name__):
 # Export commonly used items
 __all__ = [
     'Config',
-    'DevelopmentConfig',
-    'ProductionConfig',
-    'TestConfig',
+    'DEVELOPMENT_OVERRIDES',
+    'PRODUCTION_OVERRIDES',
+    'TEST_OVERRIDES',
     'config',
     'logger',
     'get_config',
@@ -246,10 +436,6 @@ __all__ = [
 ]
 
 
-# Validate configuration on import
-if __name__ != "__main__":
-    config.validate()
-else:
+if __name__ == "__main__":
     # If run directly, print configuration
-    config.print_config()
-    config.validate()
\ No newline at end of file
+    get_config().print_config()
\ No newline at end of file
@@ -8,17 +8,12 @@ Citations:
 """
 
 import streamlit as st
-import sys
 import os
+import uuid
 from datetime import datetime
-from pathlib import Path
 
-# Add backend to path
-sys.path.append(str(Path(__file__).parent.parent / 'backend'))
-
-from backend.chatbot import StudentChatbot
-from backend.memory_manager import MemoryManager
-from backend.calendar_integration import CalendarIntegration
+# Backend modules (OpenAI, Mem0, Google API clients) are imported inside
+# initialize_components() so they load only when the user initializes
 
 
 # Page configuration
@@ -31,7 +26,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+CUSTOM_CSS = """
     <style>
     .main-header {
         font-size: 2.5rem;
@@ -39,20 +34,6 @@ st.markdown("""
         text-align: center;
         margin-bottom: 1rem;
     }
-    .chat-message {
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin-bottom: 1rem;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    .user-message {
-        background-color: #e3f2fd;
-        border-left: 4px solid #2196f3;
-    }
-    .assistant-message {
-        background-color: #f5f5f5;
-        border-left: 4px solid #4caf50;
-    }
     .sidebar-info {
         background-color: #fff3e0;
         padding: 1rem;
@@ -60,7 +41,20 @@ st.markdown("""
         margin-bottom: 1rem;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+# Streamlit drops elements that are not re-emitted on a rerun, so the style
+# block has to be written every run; keeping it a constant makes that cheap.
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+
+# Quick action labels and the message each one sends
+QUICK_ACTIONS = {
+    "📅 Today's Schedule": "What are my meetings today?",
+    "📆 This Week": "Show me my schedule for this week",
+    "🧠 My Memories": "What do you know about my preferences?",
+    "⏰ Study Times": "When do I prefer to study?",
+}
 
 
 def initialize_session_state():
@@ -77,20 +71,66 @@ def initialize_session_state():
     if 'user_id' not in st.session_state:
         st.session_state.user_id = "default_user"
     
-    if 'chat_history' not in st.session_state:
-        st.session_state.chat_history = []
+    # Chat history as parallel lists (one entry per message in each)
+    if 'chat_roles' not in st.session_state:
+        clear_chat_history()
     
     if 'initialized' not in st.session_state:
         st.session_state.initialized = False
     
     if 'calendar_authenticated' not in st.session_state:
         st.session_state.calendar_authenticated = False
+    
+    if 'stats_version' not in st.session_state:
+        st.session_state.stats_version = 0
+    
+    # Keys the st.cache_data helpers below, whose cache is shared by all sessions
+    if 'session_id' not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+
+
+@st.cache_data(ttl=30)
+def _cached_stats(_chatbot, session_id: str, user_id: str, version: int) -> dict:
+    """
+    Get chatbot statistics, reused across reruns until the data changes.
+    
+    Args:
+        _chatbot (StudentChatbot): Chatbot instance (not part of the cache key)
+        session_id (str): Streamlit session, so sessions never share entries
+        user_id (str): User ID
+        version (int): Bumped whenever the user's messages or memories change
+        
+    Returns:
+        dict: Statistics dictionary
+    """
+    return _chatbot.get_statistics(user_id)
+
+
+@st.cache_data(ttl=30)
+def _cached_memories(_memory_manager, session_id: str, user_id: str, version: int) -> list:
+    """
+    Get the user's stored memories, reused across reruns until the data changes.
+    
+    Args:
+        _memory_manager (MemoryManager): Memory manager (not part of the cache key)
+        session_id (str): Streamlit session, so sessions never share entries
+        user_id (str): User ID
+        version (int): Bumped whenever the user's messages or memories change
+        
+    Returns:
+        list: Memory objects
+    """
+    return _memory_manager.get_memories(user_id, limit=10)
 
 
 def initialize_components():
     """Initialize chatbot components."""
     try:
         with st.spinner("Initializing chatbot components..."):
+            from src.backend.chatbot import StudentChatbot
+            from src.backend.memory_manager import MemoryManager
+            from src.backend.calendar_integration import CalendarIntegration
+            
             # Initialize Memory Manager
             st.session_state.memory_manager = MemoryManager()
             
@@ -128,32 +168,50 @@ def authenticate_calendar():
         return False
 
 
-def display_chat_message(role: str, content: str, timestamp: str = None):
+def clear_chat_history():
+    """Reset the chat history lists in session state."""
+    st.session_state.chat_roles = []
+    st.session_state.chat_contents = []
+    st.session_state.chat_timestamps = []
+    st.session_state.chat_ts_strs = []
+
+
+def append_chat_message(role: str, content: str):
     """
-    Display a chat message with styling.
+    Append a message to the chat history, formatting its display time once.
     
     Args:
         role (str): 'user' or 'assistant'
         content (str): Message content
-        timestamp (str): Message timestamp
     """
-    css_class = "user-message" if role == "user" else "assistant-message"
-    icon = "👤" if role == "user" else "🤖"
-    
-    timestamp_str = ""
-    if timestamp:
-        try:
-            dt = datetime.fromisoformat(timestamp)
-            timestamp_str = f"<small>{dt.strftime('%I:%M %p')}</small>"
-        except:
-            pass
+    timestamp = datetime.now()
+    st.session_state.chat_roles.append(role)
+    st.session_state.chat_contents.append(content)
+    st.session_state.chat_timestamps.append(timestamp)
+    st.session_state.chat_ts_strs.append(timestamp.strftime('%I:%M %p'))
+
+
+def queue_quick_action():
+    """Queue the selected quick action as the next message and clear the selection."""
+    choice = st.session_state.quick_action_choice
+    if choice:
+        st.session_state.pending_quick_action = QUICK_ACTIONS[choice]
+    st.session_state.quick_action_choice = None
+
+
+def display_chat_message(role: str, content: str, ts_str: str = ""):
+    """
+    Display a chat message using Streamlit's native chat widget.
     
-    st.markdown(f"""
-        <div class="chat-message {css_class}">
-            <strong>{icon} {role.capitalize()}</strong> {timestamp_str}
-            <p>{content}</p>
-        </div>
-    """, unsafe_allow_html=True)
+    Args:
+        role (str): 'user' or 'assistant'
+        content (str): Message content
+        ts_str (str): Formatted message time
+    """
+    with st.chat_message(role):
+        st.write(content)
+        if ts_str:
+            st.caption(ts_str)
 
 
 def main():
@@ -178,7 +236,7 @@ def main():
         )
         if user_id != st.session_state.user_id:
             st.session_state.user_id = user_id
-            st.session_state.chat_history = []
+            clear_chat_history()
         
         st.markdown("---")
         
@@ -208,9 +266,11 @@ def main():
         st.header("🧠 Memory")
         if st.session_state.initialized and st.session_state.memory_manager:
             if st.button("📚 View Memories", use_container_width=True):
-                memories = st.session_state.memory_manager.get_memories(
+                memories = _cached_memories(
+                    st.session_state.memory_manager,
+                    st.session_state.session_id,
                     st.session_state.user_id,
-                    limit=10
+                    st.session_state.stats_version
                 )
                 if memories:
                     st.subheader("Stored Memories")
@@ -223,6 +283,7 @@ def main():
                 result = st.session_state.memory_manager.delete_all_memories(
                     st.session_state.user_id
                 )
+                st.session_state.stats_version += 1
                 if result.get('success'):
                     st.success("Memories cleared!")
                 else:
@@ -232,9 +293,10 @@ def main():
         
         # Clear chat
         if st.button("🔄 Clear Chat History", use_container_width=True):
-            st.session_state.chat_history = []
+            clear_chat_history()
             if st.session_state.chatbot:
                 st.session_state.chatbot.reset_conversation(st.session_state.user_id)
+            st.session_state.stats_version += 1
             st.rerun()
         
         st.markdown("---")
@@ -242,7 +304,12 @@ def main():
         # Statistics
         if st.session_state.initialized and st.session_state.chatbot:
             st.header("📊 Statistics")
-            stats = st.session_state.chatbot.get_statistics(st.session_state.user_id)
+            stats = _cached_stats(
+                st.session_state.chatbot,
+                st.session_state.session_id,
+                st.session_state.user_id,
+                st.session_state.stats_version
+            )
             st.metric("Total Messages", stats.get('total_messages', 0))
             st.metric("Stored Memories", stats.get('stored_memories', 0))
         
@@ -294,43 +361,36 @@ def main():
     # Display chat history
     chat_container = st.container()
     with chat_container:
-        for message in st.session_state.chat_history:
-            display_chat_message(
-                message['role'],
-                message['content'],
-                message.get('timestamp')
-            )
+        for role, content, ts_str in zip(
+            st.session_state.chat_roles,
+            st.session_state.chat_contents,
+            st.session_state.chat_ts_strs
+        ):
+            display_chat_message(role, content, ts_str)
     
     # Chat input
     st.markdown("---")
     
     # Sample queries for quick access
     st.subheader("💡 Quick Actions")
-    col1, col2, col3, col4 = st.columns(4)
+    st.radio(
+        "Quick Actions",
+        list(QUICK_ACTIONS),
+        index=None,
+        horizontal=True,
+        key="quick_action_choice",
+        on_change=queue_quick_action,
+        label_visibility="collapsed"
+    )
     
-    with col1:
-        if st.button("📅 Today's Schedule"):
-            user_input = "What are my meetings today?"
-    with col2:
-        if st.button("📆 This Week"):
-            user_input = "Show me my schedule for this week"
-    with col3:
-        if st.button("🧠 My Memories"):
-            user_input = "What do you know about my preferences?"
-    with col4:
-        if st.button("⏰ Study Times"):
-            user_input = "When do I prefer to study?"
-    
-    # Main chat input
+    # Main chat input; a queued quick action is sent when nothing was typed
     user_input = st.chat_input("Type your message here...", key="chat_input")
+    if not user_input:
+        user_input = st.session_state.pop('pending_quick_action', None)
     
     if user_input:
         # Add user message to history
-        st.session_state.chat_history.append({
-            'role': 'user',
-            'content': user_input,
-            'timestamp': datetime.now().isoformat()
-        })
+        append_chat_message('user', user_input)
         
         # Get bot response
         with st.spinner("Thinking..."):
@@ -341,20 +401,15 @@ def main():
                 )
                 
                 # Add bot response to history
-                st.session_state.chat_history.append({
-                    'role': 'assistant',
-                    'content': response,
-                    'timestamp': datetime.now().isoformat()
-                })
+                append_chat_message('assistant', response)
                 
             except Exception as e:
                 st.error(f"Error generating response: {e}")
                 response = "I encountered an error processing your request. Please try again."
-                st.session_state.chat_history.append({
-                    'role': 'assistant',
-                    'content': response,
-                    'timestamp': datetime.now().isoformat()
-                })
+                append_chat_message('assistant', response)
+        
+        # Statistics and memories may have changed
+        st.session_state.stats_version += 1
         
         # Rerun to update chat display
         st.rerun()
@@ -1,4 +1,22 @@
 """Helper utility functions."""
 
+import json
+
+# Optional: orjson serializes several times faster than json and emits bytes directly
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def ensure_list(x):
     return x if isinstance(x, list) else [x]
+
+def json_dumps(obj, sort_keys=False) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes, using orjson when available."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(obj, sort_keys=sort_keys, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def json_loads(data):
+    """Deserialize JSON from bytes or str, using orjson when available."""
+    return orjson.loads(data) if orjson else json.loads(data)
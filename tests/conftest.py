@@ -0,0 +1,31 @@
+"""
+Shared pytest fixtures.
+
+Citation: pytest fixtures - https://docs.pytest.org/en/stable/how-to/fixtures.html
+"""
+
+import pytest
+
+from src.backend import memory_manager as memory_manager_module
+from src.backend.memory_manager import MemoryManager
+from fakes import FakeMem0
+
+
+@pytest.fixture(scope="session")
+def memory_manager():
+    """Create one MemoryManager for the whole session, backed by an in-memory Mem0 fake."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(memory_manager_module, "_build_memory", lambda config_json: FakeMem0())
+        yield MemoryManager()
+
+
+@pytest.fixture(scope="session")
+def _warmup(memory_manager):
+    """
+    Run one add, search and delete before any test, so one-time setup
+    (imports, embedder and vector store initialization) is not charged to
+    the first test.
+    """
+    memory_manager.add_memory("warmup_user", "warmup")
+    memory_manager.search_memories("warmup_user", "warmup")
+    memory_manager.delete_all_memories("warmup_user")
@@ -0,0 +1,96 @@
+"""
+Test Doubles
+In-memory stand-ins for external backends, so unit tests run without
+network, LLM or embedding-model calls.
+"""
+
+import time
+import uuid
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Union
+
+
+class FakeMem0:
+    """
+    In-memory implementation of the Mem0 Memory methods used by MemoryManager.
+    Messages are stored verbatim (no LLM fact extraction) and search ranks
+    memories by the number of words they share with the query.
+    """
+    
+    def __init__(self):
+        self.store: Dict[str, Dict[str, Any]] = {}
+        self.vector_store = FakeVectorStore(self)
+    
+    def add(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        user_id: str,
+        metadata: Optional[Dict] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Store each user message as a memory."""
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+        
+        results = []
+        for message in messages:
+            if message.get("role", "user") != "user":
+                continue
+            memory_id = uuid.uuid4().hex
+            self.store[memory_id] = {
+                "id": memory_id,
+                "memory": message["content"],
+                "user_id": user_id,
+                "metadata": dict(metadata or {}),
+                "created_at": time.time()
+            }
+            results.append({"id": memory_id, "memory": message["content"], "event": "ADD"})
+        return {"results": results}
+    
+    def get_all(self, user_id: str, limit: int = 100, **kwargs) -> List[Dict[str, Any]]:
+        """Return the user's memories in insertion order."""
+        return [m for m in self.store.values() if m["user_id"] == user_id][:limit]
+    
+    def search(self, query: str, user_id: str, limit: int = 100, **kwargs) -> List[Dict[str, Any]]:
+        """Return the user's memories sharing words with the query, best match first."""
+        words = set(query.lower().split())
+        scored = [
+            (len(words & set(m["memory"].lower().split())), m)
+            for m in self.store.values()
+            if m["user_id"] == user_id
+        ]
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [dict(m, score=float(score)) for score, m in scored[:limit] if score]
+    
+    def update(self, memory_id: str, data: str) -> Dict[str, Any]:
+        """Replace a memory's text."""
+        self.store[memory_id]["memory"] = data
+        return {"message": "Memory updated successfully!"}
+    
+    def delete(self, memory_id: str):
+        """Delete one memory."""
+        self.store.pop(memory_id, None)
+    
+    def delete_all(self, user_id: str):
+        """Delete all memories of a user."""
+        for memory_id in [k for k, m in self.store.items() if m["user_id"] == user_id]:
+            del self.store[memory_id]
+
+
+class FakeVectorStore:
+    """
+    Vector store view of a FakeMem0. There are no vectors, so every memory
+    matching the filters is a hit with score 0.
+    """
+    
+    def __init__(self, mem0: FakeMem0):
+        self.mem0 = mem0
+    
+    def search(self, query: List[float], limit: int = 5, filters: Optional[Dict] = None) -> List[SimpleNamespace]:
+        """Return memories matching the filters as Qdrant-style scored points."""
+        filters = filters or {}
+        return [
+            SimpleNamespace(id=m["id"], score=0.0, payload=dict(m["metadata"], data=m["memory"], user_id=m["user_id"]))
+            for m in self.mem0.store.values()
+            if all(m.get(k) == v for k, v in filters.items())
+        ][:limit]
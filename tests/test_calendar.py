@@ -1,2 +1,189 @@
+"""
+Unit Tests for Calendar Integration
+Tests the offline helpers used to format MCP calendar data.
+
+Citation: pytest documentation - https://docs.pytest.org/
+"""
+
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from src.backend import calendar_integration as calendar_module
+from src.backend.calendar_integration import _iso, _parse_rfc3339, _rfc3339, _retry
+
+
 def test_calendar_placeholder():
     assert True
+
+
+class TestRfc3339Parsing:
+    """Test suite for RFC3339 timestamp parsing."""
+    
+    def test_parse_zulu_suffix(self):
+        """Test that a trailing 'Z' is treated as UTC."""
+        parsed = _parse_rfc3339("2024-11-05T09:30:00Z")
+        
+        assert parsed == datetime(2024, 11, 5, 9, 30, tzinfo=timezone.utc)
+        print("✅ Zulu suffix parsing test passed")
+    
+    def test_parse_offset(self):
+        """Test that explicit offsets are preserved."""
+        parsed = _parse_rfc3339("2024-11-05T09:30:00+05:30")
+        
+        assert parsed.utcoffset().total_seconds() == 5.5 * 3600
+        print("✅ Offset parsing test passed")
+    
+    def test_format_truncates_to_minute(self):
+        """Test that query bounds are formatted at minute precision."""
+        formatted = _rfc3339(datetime(2024, 11, 5, 9, 30, 45, 123456))
+        
+        assert formatted == "2024-11-05T09:30:00Z"
+        print("✅ RFC3339 formatting test passed")
+    
+    def test_iso_from_epoch(self):
+        """Test formatting of integer Unix timestamps."""
+        ts = int(datetime(2024, 11, 5, tzinfo=timezone.utc).timestamp())
+        
+        assert _iso(ts) == "2024-11-05T00:00:00Z"
+        assert _iso(ts + 86400) == "2024-11-06T00:00:00Z"
+        print("✅ Epoch formatting test passed")
+
+
+class _StatusError(Exception):
+    """Stand-in for an MCP API error carrying an HTTP status."""
+    
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class TestRetry:
+    """Test suite for the MCP retry decorator."""
+    
+    @staticmethod
+    def _failing(status_code, calls):
+        @_retry(base_delay=0, exceptions=(_StatusError,))
+        def call():
+            calls.append(status_code)
+            raise _StatusError(status_code)
+        return call
+    
+    def test_retries_transient_errors(self):
+        """Test that 429 and 5xx responses are retried up to max_attempts."""
+        for status_code in (429, 503, 500):
+            calls = []
+            try:
+                self._failing(status_code, calls)()
+            except _StatusError:
+                pass
+            assert len(calls) == 3
+        print("✅ Transient retry test passed")
+    
+    def test_permanent_errors_not_retried(self):
+        """Test that 4xx responses other than 429 are raised immediately."""
+        for status_code in (400, 401, 403, 404):
+            calls = []
+            try:
+                self._failing(status_code, calls)()
+            except _StatusError:
+                pass
+            assert len(calls) == 1
+        print("✅ Permanent error test passed")
+
+
+class TestAuthenticationFailure:
+    """Test suite for the empty-result contract when MCP authentication fails."""
+    
+    @pytest.fixture
+    def calendar(self, monkeypatch):
+        monkeypatch.setattr(calendar_module, "ContextProtocol", object)
+        monkeypatch.setattr(calendar_module.CalendarIntegration, "authenticate", lambda self: False)
+        calendar = calendar_module.CalendarIntegration()
+        yield calendar
+        calendar._executor.shutdown(wait=False)
+    
+    def test_listing_methods_return_empty(self, calendar):
+        """Test that the calendar list and search yield empty results instead of raising."""
+        assert calendar.get_calendar_list() == []
+        assert calendar.search_events("standup") == []
+        print("✅ Authentication failure test passed")
+    
+    def test_event_methods_raise(self, calendar):
+        """Test that event fetches report the failure, so it is not mistaken for a clear schedule."""
+        for fetch in (calendar.get_events, calendar.get_today_events, calendar.get_week_events):
+            with pytest.raises(RuntimeError):
+                fetch()
+        print("✅ Event fetch authentication failure test passed")
+    
+    def test_dashboard_bundle_empty(self, calendar):
+        """Test that the dashboard bundle falls back to empty lists."""
+        bundle = calendar.get_dashboard_bundle(query="standup")
+        
+        assert bundle == {"today": [], "week": [], "calendars": [], "search": []}
+        print("✅ Dashboard bundle failure test passed")
+
+
+class _FakeClient:
+    """Authenticated MCP client stand-in that counts token refreshes."""
+    
+    def __init__(self):
+        self.refreshes = 0
+    
+    def is_authenticated(self):
+        return True
+    
+    def refresh_token(self):
+        self.refreshes += 1
+
+
+class TestSessionRefresh:
+    """Test suite for the background MCP session refresh."""
+    
+    @pytest.fixture
+    def calendar(self, monkeypatch):
+        monkeypatch.setattr(calendar_module, "ContextProtocol", object)
+        monkeypatch.setattr(calendar_module, "_CLIENT_CACHE", {})
+        calendar = calendar_module.CalendarIntegration()
+        yield calendar
+        if calendar._refresh_timer:
+            calendar._refresh_timer.cancel()
+        calendar._executor.shutdown(wait=False)
+    
+    @staticmethod
+    def _key(calendar):
+        config = calendar_module.config
+        return (calendar.mcp_server_url, config.GOOGLE_CLIENT_ID, config.GOOGLE_SCOPES)
+    
+    def test_cached_session_schedules_refresh(self, calendar):
+        """Test that handing out a cached session schedules its token refresh."""
+        client = _FakeClient()
+        calendar_module._CLIENT_CACHE[self._key(calendar)] = (client, time.monotonic() + 3600)
+        
+        assert calendar.authenticate()
+        assert calendar._refresh_timer is not None
+        print("✅ Cached session refresh test passed")
+    
+    def test_refresh_only_renews_token(self, calendar, monkeypatch):
+        """Test that a refresh renews the token instead of re-authenticating."""
+        monkeypatch.setattr(calendar_module.CalendarIntegration, "authenticate", lambda self: pytest.fail("re-authenticated"))
+        key = self._key(calendar)
+        client = _FakeClient()
+        calendar_module._CLIENT_CACHE[key] = (client, time.monotonic() + 10)
+        
+        calendar._refresh_session(key)
+        
+        assert client.refreshes == 1
+        assert calendar_module._CLIENT_CACHE[key][1] > time.monotonic() + 10
+        print("✅ Token refresh test passed")
+    
+    def test_no_timer_without_refresh_token(self, calendar):
+        """Test that no refresh is scheduled for clients that cannot refresh."""
+        key = self._key(calendar)
+        calendar_module._CLIENT_CACHE[key] = (object(), time.monotonic() + 3600)
+        
+        calendar._schedule_refresh(key)
+        
+        assert calendar._refresh_timer is None
+        print("✅ Non-refreshable session test passed")
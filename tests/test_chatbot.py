@@ -5,13 +5,12 @@ Tests main chatbot functionality and integration.
 Citation: pytest documentation - https://docs.pytest.org/
 """
 
-import pytest
-import sys
-from pathlib import Path
+import asyncio
+from types import SimpleNamespace
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent.parent / 'src' / 'backend'))
+import pytest
 
+from src.backend import calendar_integration as calendar_module
 from src.backend.chatbot import StudentChatbot
 from src.backend.memory_manager import MemoryManager
 from src.backend.calendar_integration import CalendarIntegration
@@ -20,9 +19,9 @@ from src.backend.calendar_integration import CalendarIntegration
 class TestStudentChatbot:
     """Test suite for StudentChatbot class."""
     
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def chatbot(self):
-        """Create a chatbot instance for testing."""
+        """Create a chatbot instance shared by the tests in this module."""
         return StudentChatbot()
     
     @pytest.fixture
@@ -30,6 +29,11 @@ class TestStudentChatbot:
         """Test user ID."""
         return "test_user_456"
     
+    @pytest.fixture(autouse=True)
+    def reset_history(self, chatbot, test_user_id):
+        """Start each test with an empty conversation history."""
+        chatbot.reset_conversation(test_user_id)
+    
     def test_initialization(self, chatbot):
         """Test chatbot initialization."""
         assert chatbot is not None
@@ -94,11 +98,24 @@ class TestStudentChatbot:
         assert history[1]['role'] == 'assistant'
         print("✅ Conversation history test passed")
     
+    def test_conversation_history_bounded(self, chatbot, test_user_id):
+        """Test that old messages are dropped once the history is full."""
+        for i in range(250):
+            chatbot._add_to_history(test_user_id, "user", f"Message {i}")
+        
+        history = chatbot._get_conversation_history(test_user_id)
+        recent = chatbot._get_conversation_history(test_user_id, last=5)
+        
+        assert len(history) == 200
+        assert history[-1]['content'] == "Message 249"
+        assert [msg['content'] for msg in recent] == [f"Message {i}" for i in range(245, 250)]
+        print("✅ Bounded conversation history test passed")
+    
     def test_handle_memory_storage(self, chatbot, test_user_id):
         """Test memory storage handler."""
         message = "Remember that I prefer studying in the library"
         
-        response = chatbot._handle_memory_storage(test_user_id, message)
+        response = chatbot._run_sync(chatbot._handle_memory_storage(test_user_id, message))
         
         assert isinstance(response, str)
         assert len(response) > 0
@@ -108,11 +125,11 @@ class TestStudentChatbot:
     def test_handle_memory_recall(self, chatbot, test_user_id):
         """Test memory recall handler."""
         # First add some memories
-        chatbot._handle_memory_storage(test_user_id, "I like morning study")
-        chatbot._handle_memory_storage(test_user_id, "My favorite subject is CS")
+        chatbot._run_sync(chatbot._handle_memory_storage(test_user_id, "I like morning study"))
+        chatbot._run_sync(chatbot._handle_memory_storage(test_user_id, "My favorite subject is CS"))
         
         # Recall memories
-        response = chatbot._handle_memory_recall(test_user_id, "What do you know?")
+        response = chatbot._run_sync(chatbot._handle_memory_recall(test_user_id, "What do you know?"))
         
         assert isinstance(response, str)
         assert len(response) > 0
@@ -165,6 +182,8 @@ class TestStudentChatbot:
         """Test handling multiple users."""
         user1 = "user_001"
         user2 = "user_002"
+        chatbot.reset_conversation(user1)
+        chatbot.reset_conversation(user2)
         
         # Different messages for different users
         chatbot.chat(user1, "I prefer morning study")
@@ -181,13 +200,59 @@ class TestStudentChatbot:
         print("✅ Multiple users test passed")
 
 
+class TestCalendarQuery:
+    """Test suite for calendar replies when the calendar cannot be reached."""
+    
+    @pytest.fixture
+    def chatbot(self, memory_manager, monkeypatch):
+        """Chatbot whose calendar fails to authenticate."""
+        monkeypatch.setattr(calendar_module, "ContextProtocol", object)
+        monkeypatch.setattr(calendar_module.CalendarIntegration, "authenticate", lambda self: False)
+        chatbot = StudentChatbot(memory_manager=memory_manager, calendar_integration=calendar_module.CalendarIntegration())
+        yield chatbot
+        chatbot.close()
+        chatbot.calendar._executor.shutdown(wait=False)
+    
+    @pytest.mark.parametrize("message", [
+        "What are my meetings today?",
+        "Show me my schedule this week",
+        "What's on my calendar tomorrow?"
+    ])
+    def test_authentication_failure(self, chatbot, message):
+        """Test that a failed calendar authentication is reported, not shown as a clear schedule."""
+        response = asyncio.run(chatbot._handle_calendar_query("calendar_test_user", message))
+        
+        assert "trouble accessing your calendar" in response
+        assert "schedule is clear" not in response
+        print("✅ Calendar authentication failure test passed")
+    
+    def test_failure_not_cached(self, chatbot):
+        """Test that a failed fetch is not served from the listing cache once the calendar recovers."""
+        message = "What are my meetings today?"
+        event = {
+            "summary": "Standup",
+            "start": {"dateTime": "2024-11-05T09:30:00Z"},
+            "end": {"dateTime": "2024-11-05T09:45:00Z"}
+        }
+        
+        failed = asyncio.run(chatbot._handle_calendar_query("calendar_test_user", message))
+        chatbot.calendar._service = SimpleNamespace(
+            calendar=SimpleNamespace(get_events=lambda **params: {"items": [event]})
+        )
+        recovered = asyncio.run(chatbot._handle_calendar_query("calendar_test_user", message))
+        
+        assert "trouble accessing your calendar" in failed
+        assert "Standup" in recovered
+        print("✅ Calendar failure cache test passed")
+
+
 # Integration Tests
 class TestChatbotIntegration:
     """Integration tests for complete chatbot workflow."""
     
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def chatbot(self):
-        """Create a chatbot instance."""
+        """Create a chatbot instance shared by the integration tests."""
         return StudentChatbot()
     
     @pytest.fixture
@@ -195,6 +260,11 @@ class TestChatbotIntegration:
         """Test user ID."""
         return "integration_test_user"
     
+    @pytest.fixture(autouse=True)
+    def reset_history(self, chatbot, test_user_id):
+        """Start each test with an empty conversation history."""
+        chatbot.reset_conversation(test_user_id)
+    
     def test_memory_and_chat_integration(self, chatbot, test_user_id):
         """Test integration between memory and chat."""
         # Store a preference
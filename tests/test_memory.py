@@ -5,34 +5,84 @@ Tests Mem0 integration and memory operations.
 Citation: pytest documentation - https://docs.pytest.org/
 """
 
+import logging
+import uuid
+
+import numpy as np
 import pytest
-import sys
-from pathlib import Path
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent.parent / 'src' / 'backend'))
+from src.backend import memory_manager as memory_manager_module
+from src.utils.helpers import json_loads
+
+logger = logging.getLogger(__name__)
 
-from src.backend.memory_manager import MemoryManager
+# Load the backend (see conftest.py) before the first test body runs
+pytestmark = pytest.mark.usefixtures("_warmup")
 
 
 class TestMemoryManager:
     """Test suite for MemoryManager class."""
     
+    @pytest.fixture(scope="session")
+    def _created_user_ids(self, memory_manager):
+        """Collect the test user IDs and delete their memories at the end of the session."""
+        user_ids = []
+        yield user_ids
+        for user_id in user_ids:
+            memory_manager.delete_all_memories(user_id)
+    
     @pytest.fixture
-    def memory_manager(self):
-        """Create a MemoryManager instance for testing."""
-        return MemoryManager()
+    def test_user_id(self, _created_user_ids):
+        """Unique user ID per test, so tests share no memories and can run in parallel."""
+        user_id = f"test_student_{uuid.uuid4().hex}"
+        _created_user_ids.append(user_id)
+        return user_id
+    
+    @pytest.fixture(scope="session")
+    def query_vector(self):
+        """Precomputed query embedding (768 dims, as in the default Mem0 config)."""
+        return np.zeros(768, dtype=np.float32)
+    
+    @staticmethod
+    def _seed(memory_manager, user_id):
+        """Store the two memories the post-insert checks expect."""
+        with memory_manager.batched(user_id) as batch:
+            batch.add("Summary test 1")
+            batch.add("Summary test 2")
+    
+    @pytest.fixture(scope="module")
+    def populated_manager(self, memory_manager, _created_user_ids):
+        """MemoryManager and a user ID seeded with two memories, shared by the read-only checks."""
+        user_id = f"test_student_{uuid.uuid4().hex}"
+        _created_user_ids.append(user_id)
+        self._seed(memory_manager, user_id)
+        return memory_manager, user_id
     
     @pytest.fixture
-    def test_user_id(self):
-        """Test user ID."""
-        return "test_student_123"
+    def seeded_user_id(self, memory_manager, test_user_id):
+        """Per-test user ID seeded with two memories, for checks that modify them."""
+        self._seed(memory_manager, test_user_id)
+        return test_user_id
     
     def test_initialization(self, memory_manager):
         """Test MemoryManager initialization."""
         assert memory_manager is not None
         assert memory_manager.memory is not None
-        print("✅ MemoryManager initialization test passed")
+        logger.info("✅ MemoryManager initialization test passed")
+    
+    def test_initialization_from_settings(self, monkeypatch):
+        """Test that the settings' Mem0 config is serialized and left untouched."""
+        from src.config.settings import get_config
+        
+        mem0_config = get_config().MEM0_CONFIG
+        monkeypatch.setattr(memory_manager_module, "_build_memory", lambda config_json: config_json)
+        manager = memory_manager_module.MemoryManager(config=mem0_config)
+        manager.config["vector_store"]["config"]["collection_name"] = "changed"
+        
+        built = json_loads(manager.memory)
+        assert built["vector_store"]["config"]["collection_name"] == "student_memories"
+        assert mem0_config["vector_store"]["config"]["collection_name"] == "student_memories"
+        logger.info("✅ Settings initialization test passed")
     
     def test_add_memory(self, memory_manager, test_user_id):
         """Test adding a memory."""
@@ -42,27 +92,31 @@ class TestMemoryManager:
             metadata={"category": "preference"}
         )
         
-        assert result.get('success') is True
-        print("✅ Add memory test passed")
+        assert result.get('success')
+        logger.info("✅ Add memory test passed")
     
-    def test_get_memories(self, memory_manager, test_user_id):
-        """Test retrieving memories."""
-        # First add some memories
-        memory_manager.add_memory(
-            user_id=test_user_id,
-            message="Test memory 1"
-        )
-        memory_manager.add_memory(
+    def test_add_memories_batch(self, memory_manager, test_user_id):
+        """Test adding several memories in one batch."""
+        result = memory_manager.add_memories_batch(
             user_id=test_user_id,
-            message="Test memory 2"
+            messages=["I study best at night", "My exam is on Friday"],
+            metadata={"category": "preference"}
         )
         
-        # Retrieve memories
-        memories = memory_manager.get_memories(test_user_id)
+        assert result.get('success')
+        assert len(result['result']) == 1
+        logger.info("✅ Add memories batch test passed")
+    
+    def test_batched(self, memory_manager, test_user_id):
+        """Test that batched() stores buffered memories once on exit."""
+        with memory_manager.batched(test_user_id) as batch:
+            batch.add("I review notes on Sundays")
+            batch.add("My exam is on Friday")
+            batch.add("I study in the library", metadata={"category": "location"})
         
-        assert isinstance(memories, list)
-        assert len(memories) >= 0
-        print(f"✅ Get memories test passed - Found {len(memories)} memories")
+        assert len(batch.results) == 2
+        assert all(result.get('success') for result in batch.results)
+        logger.info("✅ Batched add test passed")
     
     def test_search_memories(self, memory_manager, test_user_id):
         """Test searching memories."""
@@ -79,7 +133,29 @@ class TestMemoryManager:
         )
         
         assert isinstance(results, list)
-        print(f"✅ Search memories test passed - Found {len(results)} results")
+        logger.info("✅ Search memories test passed - Found %d results", len(results))
+    
+    def test_search_by_vector(self, memory_manager, test_user_id, query_vector):
+        """Test searching memories with a precomputed query embedding."""
+        memory_manager.add_memory(
+            user_id=test_user_id,
+            message="I love studying computer science in the library"
+        )
+        
+        results = memory_manager.search_by_vector(test_user_id, query_vector)
+        
+        assert isinstance(results, list)
+        logger.info("✅ Search by vector test passed - Found %d results", len(results))
+    
+    def test_search_cache_bounded(self, memory_manager, test_user_id, monkeypatch):
+        """Test that cached searches are capped, evicting the least recently used."""
+        monkeypatch.setattr(memory_manager_module, "_SEARCH_CACHE_SIZE", 3)
+        for i in range(10):
+            memory_manager.search_memories(test_user_id, f"query {i}")
+        
+        cached_queries = [key[1] for key in memory_manager._search_cache]
+        assert cached_queries == ["query 7", "query 8", "query 9"]
+        logger.info("✅ Search cache bound test passed")
     
     def test_memory_persistence(self, memory_manager, test_user_id):
         """Test that memories persist across operations."""
@@ -92,42 +168,47 @@ class TestMemoryManager:
         
         # Retrieve and verify
         memories = memory_manager.get_memories(test_user_id)
-        memory_texts = [m.get('memory', '') for m in memories]
         
-        # Check if our test message is in the retrieved memories
-        found = any(test_message in text for text in memory_texts)
-        assert found, "Memory not found after adding"
-        print("✅ Memory persistence test passed")
+        # Check if our test message is in the retrieved memories (single pass)
+        assert any(test_message in m.get('memory', '') for m in memories), "Memory not found after adding"
+        logger.info("✅ Memory persistence test passed")
     
-    def test_delete_all_memories(self, memory_manager, test_user_id):
-        """Test deleting all memories for a user."""
-        # Add some memories
-        memory_manager.add_memory(test_user_id, "Test 1")
-        memory_manager.add_memory(test_user_id, "Test 2")
+    @pytest.mark.parametrize("action", ["list", "summary"])
+    def test_post_insert(self, populated_manager, action):
+        """Test retrieving and summarizing the seeded memories (read-only, so the seed is shared)."""
+        memory_manager, user_id = populated_manager
         
-        # Delete all
-        result = memory_manager.delete_all_memories(test_user_id)
+        if action == "list":
+            memories = memory_manager.get_memories(user_id)
+            assert isinstance(memories, list)
+            assert any("Summary test 1" in m.get('memory', '') for m in memories)
         
-        assert result.get('success') is True
+        elif action == "summary":
+            summary = memory_manager.get_memory_summary(user_id)
+            assert isinstance(summary, str)
+            assert len(summary) > 0
+            assert "Summary test" in summary
         
-        # Verify deletion
-        memories = memory_manager.get_memories(test_user_id)
-        assert len(memories) == 0
-        print("✅ Delete all memories test passed")
+        logger.info("✅ Post-insert %s test passed", action)
     
-    def test_get_memory_summary(self, memory_manager, test_user_id):
-        """Test getting memory summary."""
-        # Add some memories
-        memory_manager.add_memory(test_user_id, "Summary test 1")
-        memory_manager.add_memory(test_user_id, "Summary test 2")
+    def test_replace_memories(self, memory_manager, seeded_user_id):
+        """Test replacing all of a user's memories."""
+        result = memory_manager.replace_memories(seeded_user_id, ["Replaced memory"])
+        assert result.get('success')
         
-        # Get summary
-        summary = memory_manager.get_memory_summary(test_user_id)
+        memories = memory_manager.get_memories(seeded_user_id)
+        assert any("Replaced memory" in m.get('memory', '') for m in memories)
+        assert not any("Summary test" in m.get('memory', '') for m in memories)
+        logger.info("✅ Replace memories test passed")
+    
+    def test_delete_all_memories(self, memory_manager, seeded_user_id):
+        """Test deleting all memories for a user."""
+        result = memory_manager.delete_all_memories(seeded_user_id)
+        assert result.get('success')
         
-        assert isinstance(summary, str)
-        assert len(summary) > 0
-        assert "Summary test" in summary
-        print("✅ Get memory summary test passed")
+        # Verify deletion
+        assert len(memory_manager.get_memories(seeded_user_id)) == 0
+        logger.info("✅ Delete all memories test passed")
     
     def test_memory_metadata(self, memory_manager, test_user_id):
         """Test memory metadata handling."""
@@ -143,8 +224,8 @@ class TestMemoryManager:
             metadata=metadata
         )
         
-        assert result.get('success') is True
-        print("✅ Memory metadata test passed")
+        assert result.get('success')
+        logger.info("✅ Memory metadata test passed")
 
 
 # Run tests
@@ -0,0 +1,31 @@
+"""
+Unit Tests for Configuration Settings
+Tests how the configuration is resolved from the environment.
+
+Citation: pytest documentation - https://docs.pytest.org/
+"""
+
+from src.config import settings
+
+
+class TestConfigFromEnv:
+    """Test suite for Config.from_env."""
+    
+    def test_scalar_overrides(self, monkeypatch):
+        """Test that scalar settings are read and converted from the environment."""
+        monkeypatch.setattr(settings, "_ENV", {"OPENAI_MAX_TOKENS": "123", "DEBUG_MODE": "true", "MEM0_ORG_ID": "org"})
+        config = settings.Config.from_env()
+        
+        assert config.OPENAI_MAX_TOKENS == 123
+        assert config.DEBUG_MODE is True
+        assert config.MEM0_ORG_ID == "org"
+        print("✅ Scalar override test passed")
+    
+    def test_structured_settings_ignored(self, monkeypatch):
+        """Test that tuple and path settings are not replaced by raw environment strings."""
+        monkeypatch.setattr(settings, "_ENV", {"GOOGLE_SCOPES": "https://example.com/scope", "DB_PATH": "other.db"})
+        config = settings.Config.from_env()
+        
+        assert config.GOOGLE_SCOPES == settings._GOOGLE_SCOPES
+        assert config.DB_PATH == settings.DATA_DIR / 'chatbot.db'
+        print("✅ Structured setting test passed")